@@ -1,12 +1,337 @@
 #Version 2/14/24 Add IsLog option and logging functions
 #Version 8/29/24 change arg name to path_err_codes and add docstring
+#Version 10/18/26 add .dict_base_codes/.dict_msgs lookups for RecordErr
+#                 add process-wide cache of imported error code catalogs
+#                 add .csv/.json/.pkl catalog formats and compiled .pkl sidecar
+#                 import error codes lazily on first lookup
+#                 accumulate messages as ErrRecord list with optional cap
+#                 aggregate repeated (Locn, iCodeReport) errors with counts
+#                 add IsAsyncReport option to print/log via background thread
+#                 add IsThreadSafe option with per-thread/task error context
 import pandas as pd
 import os
+import sys
+import time
+import contextvars
+import argparse
+import threading
+import queue
+import atexit
 import logging
+import logging.handlers
 logger = logging.getLogger(__name__)
 
 #Global code to flag Base error code not found in .df_errs
 iErrNotFound = 10000
+
+#Process-wide cache of ErrCodeCatalog instances keyed by error codes file path
+dict_catalog_cache = {}
+lock_catalog_cache = threading.Lock()
+
+#Supported catalog file extensions and extension of compiled sidecar file
+lst_catalog_exts = ['.xlsx', '.xlsm', '.csv', '.json', '.pkl']
+ext_sidecar = '.pkl'
+"""
+=========================================================================
+Error code catalog functions. An ErrCodeCatalog holds the imported
+error codes df and the lookup dicts that ErrorHandle.RecordErr uses.
+Catalogs are cached by file path and reused as long as the file's
+modification time and size are unchanged, so instancing many ErrorHandle
+(or preflight.CheckDataFrame) objects reads ErrorCodes.xlsx only once.
+Cached dfs are shared, so assign a new ErrorHandle.df_errs rather than
+modifying it in place.
+
+Catalogs can be .xlsx (Errors_ sheet), .csv, .json (records) or a
+compiled .pkl file. When reading .xlsx, a compiled .pkl sidecar with the
+same base name is read instead if it was compiled from the .xlsx with its
+current modification time and size (stored in the sidecar df's attrs);
+otherwise the .xlsx is read and the sidecar is (re)written. Run this
+module as a script to compile a catalog ahead of deployment:
+    python error_handling.py path/ErrorCodes.xlsx [-o path/ErrorCodes.pkl]
+=========================================================================
+"""
+class ErrCodeCatalog:
+    def __init__(self, df_errs, file_stamp=None):
+        """
+        Imported error codes df and its lookup dicts
+        JDL 10/18/26
+        """
+        self.df_errs = df_errs
+        self.file_stamp = file_stamp # (mtime, size) of source file when read
+        self.dict_base_codes, self.dict_msgs = build_err_code_dicts(df_errs)
+
+def build_err_code_dicts(df_errs):
+    """
+    Return Locn->Base iCode and iCode->Msg_String lookup dicts for df_errs
+    (first matching row wins, consistent with prior .values[0] lookups)
+    JDL 10/18/26
+    """
+    #Base code for each Locn from its Msg_String == 'Base' row
+    df_base = df_errs.loc[df_errs['Msg_String'] == 'Base'].drop_duplicates('Locn')
+    dict_base_codes = dict(zip(df_base['Locn'], df_base['iCode']))
+
+    #Message string for each iCode
+    df_msgs = df_errs.drop_duplicates('iCode')
+    dict_msgs = dict(zip(df_msgs['iCode'], df_msgs['Msg_String']))
+    return dict_base_codes, dict_msgs
+
+def file_stamp(path_file):
+    """
+    Return (modification time, size) tuple used to detect a changed file
+    JDL 10/18/26
+    """
+    stat = os.stat(path_file)
+    return (stat.st_mtime_ns, stat.st_size)
+
+def get_err_codes_catalog(path_file, IsCache=True, IsSidecar=True):
+    """
+    Return ErrCodeCatalog for path_file --from cache if file is unchanged
+    JDL 10/18/26; Modified 10/18/26 to read alternate formats and sidecar
+    """
+    key = os.path.abspath(path_file)
+    stamp = file_stamp(path_file)
+
+    #Return cached catalog if file has same mtime and size as when read
+    with lock_catalog_cache:
+        catalog = dict_catalog_cache.get(key)
+    if IsCache and (catalog is not None) and (catalog.file_stamp == stamp):
+        return catalog
+
+    #Import error codes from file and (re)populate the cache
+    df_errs = read_err_codes(path_file, IsSidecar)
+    catalog = ErrCodeCatalog(df_errs, stamp)
+    if IsCache:
+        with lock_catalog_cache: dict_catalog_cache[key] = catalog
+    return catalog
+
+def read_err_codes(path_file, IsSidecar=False):
+    """
+    Import error codes df from .xlsx, .csv, .json or compiled .pkl file
+    JDL 10/18/26
+    """
+    ext = os.path.splitext(path_file)[1].lower()
+    if not ext in lst_catalog_exts:
+        raise ValueError('Unsupported error codes file type: ' + path_file)
+
+    if ext == '.csv': return pd.read_csv(path_file)
+    if ext == '.json': return pd.read_json(path_file, orient='records')
+    if ext == '.pkl': return pd.read_pickle(path_file)
+
+    #Excel file: use compiled sidecar if current; else read and write sidecar
+    path_sidecar = os.path.splitext(path_file)[0] + ext_sidecar
+    if IsSidecar:
+        df_errs = read_sidecar(path_file, path_sidecar)
+        if df_errs is not None: return df_errs
+
+    #Stamp df with source file's (mtime, size) for sidecar currency checks
+    df_errs = pd.read_excel(path_file, sheet_name='Errors_')
+    df_errs.attrs['file_stamp'] = file_stamp(path_file)
+    if IsSidecar: write_err_codes(df_errs, path_sidecar)
+    return df_errs
+
+def read_sidecar(path_file, path_sidecar):
+    """
+    Return error codes df from compiled sidecar if it was compiled from
+    path_file with its current (mtime, size) stamp; otherwise None
+    JDL 10/18/26
+    """
+    if not os.path.isfile(path_sidecar): return None
+    try:
+        df_errs = pd.read_pickle(path_sidecar)
+    except Exception:
+        logger.warning('Unreadable error codes sidecar: ' + path_sidecar)
+        return None
+    if df_errs.attrs.get('file_stamp') != file_stamp(path_file): return None
+    return df_errs
+
+def is_sidecar_current(path_file, path_sidecar):
+    """
+    True if compiled sidecar exists and was compiled from path_file with
+    its current modification time and size
+    JDL 10/18/26; Modified 10/18/26 to compare stored source file stamp
+    """
+    return read_sidecar(path_file, path_sidecar) is not None
+
+def write_err_codes(df_errs, path_out):
+    """
+    Write error codes df to .pkl, .csv or .json (True if written). Written
+    to a temp file then renamed so concurrent readers never see a partial
+    file. Write failures (e.g. read-only directory) are logged, not raised
+    JDL 10/18/26; Modified 10/18/26 for atomic replace
+    """
+    ext = os.path.splitext(path_out)[1].lower()
+    path_tmp = path_out + '.' + str(os.getpid()) + '_' + str(threading.get_ident()) + '.tmp'
+    try:
+        if ext == '.csv':
+            df_errs.to_csv(path_tmp, index=False)
+        elif ext == '.json':
+            df_errs.to_json(path_tmp, orient='records', indent=1)
+        else:
+            df_errs.to_pickle(path_tmp, compression=None)
+        os.replace(path_tmp, path_out)
+        return True
+    except OSError:
+        logger.warning('Could not write error codes file: ' + path_out)
+        if os.path.isfile(path_tmp): os.remove(path_tmp)
+        return False
+
+def compile_err_codes(path_file, path_out=None):
+    """
+    Compile error codes file (default to .pkl sidecar); return output path
+    JDL 10/18/26
+    """
+    if path_out is None: path_out = os.path.splitext(path_file)[0] + ext_sidecar
+    df_errs = read_err_codes(path_file)
+    if not write_err_codes(df_errs, path_out):
+        raise OSError('Could not write error codes file: ' + path_out)
+    return path_out
+
+def clear_err_codes_cache(path_file=None):
+    """
+    Invalidate cached catalog for path_file (or all catalogs if None)
+    JDL 10/18/26
+    """
+    with lock_catalog_cache:
+        if path_file is None:
+            dict_catalog_cache.clear()
+        else:
+            dict_catalog_cache.pop(os.path.abspath(path_file), None)
+"""
+=========================================================================
+Asynchronous reporting. With ErrorHandle IsAsyncReport=True, ReportError
+puts messages on a process-wide queue via a QueueHandler and returns
+without waiting on print or log file I/O. A QueueListener thread prints
+and/or logs them (through the error_handling logger) in order. The queue
+is flushed at interpreter exit and before log files are deleted or reset.
+=========================================================================
+"""
+queue_reports = queue.Queue()
+listener_reports = None
+lock_reports = threading.Lock()
+
+#Non-propagating logger that feeds the queue (not the root log handlers)
+logger_async = logging.getLogger(__name__ + '.async')
+logger_async.propagate = False
+logger_async.setLevel(logging.INFO)
+
+class ReportWriterHandler(logging.Handler):
+    def emit(self, record):
+        """
+        Print and/or log a queued report message (runs on listener thread)
+        JDL 10/18/26
+        """
+        msg = record.getMessage()
+        if record.IsPrint: print(msg)
+        if record.IsLog: logger.error(msg)
+
+def start_async_reports():
+    """
+    Start the background report writer if not already running
+    JDL 10/18/26
+    """
+    global listener_reports
+    with lock_reports:
+        if listener_reports is not None: return
+        logger_async.addHandler(logging.handlers.QueueHandler(queue_reports))
+        listener_reports = logging.handlers.QueueListener(queue_reports, \
+                                                          ReportWriterHandler())
+        listener_reports.start()
+
+def flush_async_reports():
+    """
+    Wait until all queued report messages have been written
+    JDL 10/18/26
+    """
+    if listener_reports is not None: queue_reports.join()
+
+def stop_async_reports():
+    """
+    Flush queued report messages and stop the background writer
+    JDL 10/18/26
+    """
+    global listener_reports
+    with lock_reports:
+        if listener_reports is None: return
+        listener_reports.stop()
+        for handler in list(logger_async.handlers): logger_async.removeHandler(handler)
+        listener_reports = None
+
+#Write any queued report messages before interpreter exit
+atexit.register(stop_async_reports)
+"""
+=========================================================================
+Record of one reported error or warning (ErrorHandle.lst_err_records)
+=========================================================================
+"""
+class ErrRecord:
+    __slots__ = ('iCodeReport', 'Locn', 'ErrParam', 'severity', 'timestamp', 'msg')
+
+    def __init__(self, iCodeReport, Locn, ErrParam, severity, msg):
+        """
+        Initialize record with reported code, location, param and message
+        JDL 10/18/26
+        """
+        self.iCodeReport = iCodeReport
+        self.Locn = Locn
+        self.ErrParam = ErrParam
+        self.severity = severity # 'ERROR' or 'WARNING'
+        self.timestamp = time.time()
+        self.msg = msg # Reported .ErrMsg string
+class ErrAggregate:
+    __slots__ = ('Locn', 'iCodeReport', 'severity', 'msg_base', 'count', \
+                 'lst_params')
+
+    def __init__(self, Locn, iCodeReport, severity, msg_base):
+        """
+        Count and sample ErrParams of repeated (Locn, iCodeReport) errors
+        JDL 10/18/26
+        """
+        self.Locn = Locn
+        self.iCodeReport = iCodeReport
+        self.severity = severity # 'ERROR' or 'WARNING'
+        self.msg_base = msg_base # Looked-up message without ErrParam
+        self.count = 0
+        self.lst_params = [] # Sample of ErrParam values (up to nSampleParams)
+"""
+=========================================================================
+Per-error ErrorHandle attributes (.Locn, .iCodeLocal etc.). Normally
+these are ordinary instance attributes. After ErrorHandle.SetThreadSafe,
+each thread (or asyncio task) gets its own copy, initialized from the
+instance values, so concurrent checks sharing one handler don't
+overwrite each other's in-flight error. Context dicts and the values in
+them (e.g. .lst_err_msg) are replaced rather than modified so asyncio
+tasks that copy a context stay separate.
+=========================================================================
+"""
+class ErrContextAtt:
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, obj, objtype=None):
+        """
+        Return attribute from current thread/task context if thread safe
+        JDL 10/18/26
+        """
+        if obj is None: return self
+        var = obj.__dict__.get('_var_context')
+        if var is not None: return obj.ErrContext()[self.name]
+        try:
+            return obj.__dict__[self.name]
+        except KeyError:
+            raise AttributeError(self.name) from None
+
+    def __set__(self, obj, value):
+        """
+        Set attribute in current thread/task context if thread safe
+        JDL 10/18/26
+        """
+        var = obj.__dict__.get('_var_context')
+        if var is None:
+            obj.__dict__[self.name] = value
+            return
+        ctx = dict(obj.ErrContext())
+        ctx[self.name] = value
+        var.set(ctx)
 """
 =========================================================================
 This class performs error handling. It refers to the ErrorCodes.xlsx file
@@ -31,7 +356,10 @@ checks should be conducted to evaluate as True for error conditions.
 """
 class ErrorHandle:
     def __init__(self, path_err_codes, ErrMsgHeader='', IsHandle=True, \
-                 IsPrint=True, IsLog=False):
+                 IsPrint=True, IsLog=False, IsCacheCodes=True, \
+                 f_err_codes='ErrorCodes.xlsx', IsSidecarCodes=True, \
+                 MaxMsgs=None, IsAggregate=False, nSampleParams=5, \
+                 IsAsyncReport=False, IsThreadSafe=False):
 
         self.IsHandle = IsHandle
 
@@ -41,19 +369,224 @@ class ErrorHandle:
         self.iCodeReport = 0 # Lookup code for error message (Base + Local)
         self.ErrParam = None # Optional param to append to error message
         self.ErrHeader = ErrMsgHeader # Error message header string
-        self.ErrMsg = '' # Error message string
+        self.lst_err_msg = [] # Lines of .ErrMsg error message string
+        self.ErrMsgBase = '' # Latest looked-up message without ErrParam
         self.IsNewErr = True # Flag for new error
         self.IsErr = False # Flag if error occurred
 
-        #Import error codes from Excel file
-        self.df_errs = pd.read_excel(path_err_codes + 'ErrorCodes.xlsx', \
-                                     sheet_name='Errors_')
+        #Error codes file is imported (or cached import reused) on first access
+        #of .df_errs or lookup dicts --e.g. first RecordErr
+        self.path_file_codes = path_err_codes + f_err_codes
+        self.IsCacheCodes = IsCacheCodes
+        self.IsSidecarCodes = IsSidecarCodes
+        if not os.path.isfile(self.path_file_codes):
+            raise FileNotFoundError('Error codes file not found: ' + self.path_file_codes)
+        self._df_errs = None
+        self._dict_base_codes = None
+        self._dict_msgs = None
 
         self.IsWarning = False  # Flag warning (non-fatal error)
         self.IsPrint = IsPrint  # Toggle printing from ReportError
         self.IsLog = IsLog # Toggle logging from ReportError
-        self.Msgs_Accum = ''  # String with accumulated error/warning messages
-        
+
+        #Toggle printing/logging via background thread (see start_async_reports)
+        self.IsAsyncReport = IsAsyncReport
+        if IsAsyncReport: start_async_reports()
+
+        #Accumulated error/warning records (.Msgs_Accum joins their messages)
+        self.lst_err_records = []
+        self.MaxMsgs = MaxMsgs # Optional cap on number of stored records
+        self.nMsgsDropped = 0 # Count of records not stored due to cap
+        self.dict_dropped_counts = {} # iCodeReport->count of records not stored
+        self._Msgs_Accum = '' # Cached join of record messages
+
+        #(Locn, iCodeReport)->ErrAggregate counts; if .IsAggregate, only the
+        #first occurrence of each is stored as a record and printed
+        self.dict_err_aggs = {}
+        self.IsAggregate = IsAggregate
+        self.nSampleParams = nSampleParams
+
+        #Lock for accumulated records; optional per-thread/task error context
+        self.lock_records = threading.RLock()
+        self.IsThreadSafe = False
+        if IsThreadSafe: self.SetThreadSafe()
+
+    #Per-error attributes (per thread/task if .IsThreadSafe; see ErrContextAtt)
+    lst_context_atts = ['Locn', 'iCodeLocal', 'iCodeBase', 'iCodeReport', \
+                        'ErrParam', 'lst_err_msg', 'ErrMsgBase', 'IsErr']
+    Locn = ErrContextAtt()
+    iCodeLocal = ErrContextAtt()
+    iCodeBase = ErrContextAtt()
+    iCodeReport = ErrContextAtt()
+    ErrParam = ErrContextAtt()
+    lst_err_msg = ErrContextAtt()
+    ErrMsgBase = ErrContextAtt()
+    IsErr = ErrContextAtt()
+
+    def SetThreadSafe(self):
+        """
+        Keep per-error attributes per thread/asyncio task from now on
+        JDL 10/18/26
+        """
+        if self.IsThreadSafe: return
+        self._var_context = contextvars.ContextVar('ErrorHandle_' + str(id(self)))
+        self.IsThreadSafe = True
+
+    def __getstate__(self):
+        """
+        Return state for pickle/deepcopy without the lock and context var
+        (current thread/task's per-error attributes become instance values)
+        JDL 10/18/26
+        """
+        state = dict(self.__dict__)
+        if self.IsThreadSafe:
+            state.update(self.ErrContext())
+            state['lst_err_msg'] = list(state['lst_err_msg'])
+        state.pop('lock_records', None)
+        state.pop('_var_context', None)
+        state['IsThreadSafe_pickled'] = state['IsThreadSafe']
+        state['IsThreadSafe'] = False
+        return state
+
+    def __setstate__(self, state):
+        """
+        Restore pickled/copied state; rebuild lock and (if thread safe
+        when pickled) per-thread/task error context
+        JDL 10/18/26
+        """
+        IsThreadSafe = state.pop('IsThreadSafe_pickled', False)
+        self.__dict__.update(state)
+        self.lock_records = threading.RLock()
+        if IsThreadSafe: self.SetThreadSafe()
+
+    def ErrContext(self):
+        """
+        Return current thread/task's dict of per-error attributes (if
+        none yet, initialize from instance values set before SetThreadSafe)
+        JDL 10/18/26
+        """
+        ctx = self._var_context.get(None)
+        if ctx is None:
+            ctx = {att:self.__dict__[att] for att in self.lst_context_atts}
+            ctx['lst_err_msg'] = list(ctx['lst_err_msg'])
+            self._var_context.set(ctx)
+        return ctx
+
+    @property
+    def ErrMsg(self):
+        """
+        Error message string (joined from .lst_err_msg lines)
+        JDL 10/18/26
+        """
+        return '\n'.join(self.lst_err_msg)
+
+    @ErrMsg.setter
+    def ErrMsg(self, msg):
+        """
+        Set error message string (empty string clears it)
+        JDL 10/18/26
+        """
+        self.lst_err_msg = [msg] if len(msg) > 0 else []
+
+    @property
+    def Msgs_Accum(self):
+        """
+        String with accumulated error/warning messages (joined when accessed)
+        JDL 10/18/26
+        """
+        with self.lock_records:
+            if self._Msgs_Accum is None:
+                lst = [rec.msg for rec in self.lst_err_records]
+                if self.nMsgsDropped > 0:
+                    lst.append('Additional messages not stored: ' + \
+                               str(self.nMsgsDropped))
+                self._Msgs_Accum = '\n'.join(lst)
+            return self._Msgs_Accum
+
+    @Msgs_Accum.setter
+    def Msgs_Accum(self, msgs):
+        """
+        Reset accumulated records (to a single record if msgs non-empty)
+        JDL 10/18/26
+        """
+        with self.lock_records:
+            self.lst_err_records = []
+            self.nMsgsDropped = 0
+            self.dict_dropped_counts = {}
+            self.dict_err_aggs = {}
+            if len(msgs) > 0:
+                self.lst_err_records.append(ErrRecord(None, '', None, 'ERROR', msgs))
+            self._Msgs_Accum = None
+
+    @property
+    def df_errs(self):
+        """
+        DataFrame of error codes and messages (imported on first access)
+        JDL 10/18/26
+        """
+        if self._df_errs is None: self.LoadCatalog()
+        return self._df_errs
+
+    @df_errs.setter
+    def df_errs(self, df):
+        """
+        Set .df_errs and rebuild the lookup dicts used by RecordErr
+        JDL 10/18/26
+        """
+        self._df_errs = df
+        self.BuildErrCodeIndex()
+
+    @property
+    def dict_base_codes(self):
+        """
+        Locn->Base iCode lookup dict (imported on first access)
+        JDL 10/18/26
+        """
+        if self._dict_base_codes is None: self.LoadCatalog()
+        return self._dict_base_codes
+
+    @property
+    def dict_msgs(self):
+        """
+        iCode->Msg_String lookup dict (imported on first access)
+        JDL 10/18/26
+        """
+        if self._dict_msgs is None: self.LoadCatalog()
+        return self._dict_msgs
+
+    @property
+    def IsCodesLoaded(self):
+        """
+        True if error codes have been imported (or assigned)
+        JDL 10/18/26
+        """
+        return self._df_errs is not None
+
+    def LoadCatalog(self):
+        """
+        Import error codes file (or reuse process-wide cached import)
+        JDL 10/18/26
+        """
+        catalog = get_err_codes_catalog(self.path_file_codes, \
+                        IsCache=self.IsCacheCodes, IsSidecar=self.IsSidecarCodes)
+        self.SetCatalog(catalog)
+
+    def BuildErrCodeIndex(self):
+        """
+        Build Locn->Base iCode and iCode->Msg_String lookup dicts from .df_errs
+        JDL 10/18/26
+        """
+        self._dict_base_codes, self._dict_msgs = build_err_code_dicts(self._df_errs)
+
+    def SetCatalog(self, catalog):
+        """
+        Set .df_errs and lookup dicts from a (shared) ErrCodeCatalog instance
+        JDL 10/18/26
+        """
+        self._df_errs = catalog.df_errs
+        self._dict_base_codes = catalog.dict_base_codes
+        self._dict_msgs = catalog.dict_msgs
+
     """
     ================================================================================
     RecordErr Procedure - record/report an error or warning
@@ -73,19 +606,10 @@ class ErrorHandle:
     def GetBaseErrCode(self):
         """
         Look up Base .df_errs code for .Locn
-        JDL 1/2/24
+        JDL 1/2/24; Modified 10/18/26 to use .dict_base_codes lookup
         """
-        self.iCodeBase = iErrNotFound
-
-        # Exit if self.Locn not  .df_errs Locn column values
-        if self.Locn not in self.df_errs['Locn'].values: return
-
-        # Find the Base row for self.Locn
-        fil = (self.df_errs['Locn'] == self.Locn) & (self.df_errs['Msg_String'] == 'Base')
-        base_row = self.df_errs.loc[fil]
-
-        # Assign .iCodeBase to iCode from Locn + Msg_String match row
-        if not base_row.empty: self.iCodeBase = base_row['iCode'].values[0]
+        # Lookup Base row's iCode for self.Locn (iErrNotFound if no Base row)
+        self.iCodeBase = self.dict_base_codes.get(self.Locn, iErrNotFound)
 
     def SetReportErrCode(self):
         """
@@ -99,7 +623,7 @@ class ErrorHandle:
     def AppendErrMsg(self):
         """
         Append error message for iCodeReport
-        JDL 1/2/24
+        JDL 1/2/24; Modified 10/18/26 to use .dict_msgs and .lst_err_msg
         """
         if not self.IsNewErr: return
 
@@ -107,40 +631,149 @@ class ErrorHandle:
         if self.iCodeBase == iErrNotFound:
             msgNew = "Base error code not found for function: " + self.Locn
         else:
-            fil = self.df_errs['iCode'] == self.iCodeReport
-            err_row = self.df_errs.loc[fil]
-            if not err_row.empty:
-                msgNew = err_row['Msg_String'].values[0]
-            else:
+            msgNew = self.dict_msgs.get(self.iCodeReport)
+            if msgNew is None:
                 msgNew = 'Error code not found for ' + self.Locn +\
                             ': ' + str(self.iCodeReport)
 
-        # Initialize .ErrMsg if empty then append new message
-        if len(self.ErrMsg) > 0: self.ErrMsg = self.ErrMsg + '\n'
-        self.ErrMsg = self.ErrMsg + msgNew
-
         # Append ErrParam if specified when ReportErr called
-        if self.ErrParam is not None: self.ErrMsg = self.ErrMsg + ': ' + self.ErrParam
+        self.ErrMsgBase = msgNew
+        if self.ErrParam is not None: msgNew = msgNew + ': ' + self.ErrParam
+
+        # Append new message as a line of .ErrMsg (new list; copy-on-write so
+        # asyncio tasks sharing a copied context don't see each other's lines)
+        self.lst_err_msg = self.lst_err_msg + [msgNew]
 
     def ReportError(self):
         """
         Reports an error based on the ErrMsg attribute
-        JDL 1/2/24
+        JDL 1/2/24; Modified 10/18/26 to store ErrRecord instead of string +=
         """
         # Exit if .ErrMsg is empty
-        if self.ErrMsg == '': return
+        if len(self.lst_err_msg) == 0: return
+
+        # Lock so concurrent reports don't interleave (if .IsThreadSafe)
+        with self.lock_records:
+
+            # Add record for .Msgs_Accum (exit if aggregating repeated error)
+            if not self.AddErrRecord(): return
+
+            # Print the error message 
+            if self.IsPrint:
+                if (len(self.ErrHeader)>0) & (not self.IsWarning): 
+                    self.WriteReport(self.ErrHeader)
+                self.WriteReport(self.ErrMsg)
+
+    def WriteReport(self, msg):
+        """
+        Print and optionally log msg (queued to background writer if async)
+        JDL 10/18/26
+        """
+        if self.IsAsyncReport:
+            if listener_reports is None: start_async_reports()
+            logger_async.info(msg, extra={'IsPrint':True, 'IsLog':self.IsLog})
+            return
+        print(msg)
+        if self.IsLog: logger.error(msg)
+
+    def AddErrRecord(self):
+        """
+        Append ErrRecord for current error (or only count it if at .MaxMsgs)
+        Return False if .IsAggregate and error is a repeat (not to be printed)
+        JDL 10/18/26; Modified 10/18/26 to count in .dict_err_aggs
+        """
+        severity = 'WARNING' if self.IsWarning else 'ERROR'
+
+        with self.lock_records:
+
+            # Count (Locn, iCodeReport) occurrence; exit if aggregating a repeat
+            agg = self.AggregateErr(severity)
+            if self.IsAggregate and (agg.count > 1): return False
+
+            self.StoreErrRecord(ErrRecord(self.iCodeReport, self.Locn, \
+                                          self.ErrParam, severity, self.ErrMsg))
+        return True
+
+    def StoreErrRecord(self, rec):
+        """
+        Append rec to .lst_err_records (or only count it if at .MaxMsgs)
+        JDL 10/18/26
+        """
+        self._Msgs_Accum = None
+
+        # If capped, count records beyond .MaxMsgs by code instead of storing
+        if (self.MaxMsgs is not None) and (len(self.lst_err_records) >= self.MaxMsgs):
+            self.nMsgsDropped += 1
+            n = self.dict_dropped_counts.get(rec.iCodeReport, 0)
+            self.dict_dropped_counts[rec.iCodeReport] = n + 1
+            return
+        self.lst_err_records.append(rec)
+
+    def MergeRecords(self, errs_other):
+        """
+        Merge another ErrorHandle's accumulated records and counts (e.g.
+        from a per-worker handler) into this one in a deterministic order
+        JDL 10/18/26
+        """
+        with self.lock_records, errs_other.lock_records:
+            set_keys_prior = set(self.dict_err_aggs)
+
+            # Append other's records (if aggregating, skip already-seen errors)
+            for rec in errs_other.lst_err_records:
+                key = (rec.Locn, rec.iCodeReport)
+                if self.IsAggregate and (key in set_keys_prior): continue
+                self.StoreErrRecord(rec)
 
-        # Append .ErrMsg to .ErrMsgsAccum
-        if self.Msgs_Accum: self.Msgs_Accum += '\n'
-        self.Msgs_Accum += self.ErrMsg
+            # Add other's dropped counts
+            self.nMsgsDropped += errs_other.nMsgsDropped
+            for code, n in errs_other.dict_dropped_counts.items():
+                self.dict_dropped_counts[code] = self.dict_dropped_counts.get(code, 0) + n
 
-        # Print the error message 
-        if self.IsPrint:
-            if (len(self.ErrHeader)>0) & (not self.IsWarning): 
-                print(self.ErrHeader)
-                if self.IsLog: logger.error(self.ErrHeader)
-            print(self.ErrMsg)
-            if self.IsLog: logger.error(self.ErrMsg)
+            # Add other's aggregate counts and sample params
+            for key, agg_other in errs_other.dict_err_aggs.items():
+                agg = self.dict_err_aggs.get(key)
+                if agg is None:
+                    agg = ErrAggregate(agg_other.Locn, agg_other.iCodeReport, \
+                                       agg_other.severity, agg_other.msg_base)
+                    self.dict_err_aggs[key] = agg
+                agg.count += agg_other.count
+                n_room = self.nSampleParams - len(agg.lst_params)
+                if n_room > 0: agg.lst_params.extend(agg_other.lst_params[:n_room])
+            self._Msgs_Accum = None
+
+    def AggregateErr(self, severity):
+        """
+        Increment count and sample ErrParam for current (Locn, iCodeReport)
+        JDL 10/18/26
+        """
+        key = (self.Locn, self.iCodeReport)
+        agg = self.dict_err_aggs.get(key)
+        if agg is None:
+            agg = ErrAggregate(self.Locn, self.iCodeReport, severity, self.ErrMsgBase)
+            self.dict_err_aggs[key] = agg
+
+        agg.count += 1
+        if (self.ErrParam is not None) and (len(agg.lst_params) < self.nSampleParams):
+            agg.lst_params.append(self.ErrParam)
+        return agg
+
+    def ReportSummary(self):
+        """
+        Return (and print if .IsPrint) summary of error counts by Locn/code
+        JDL 10/18/26
+        """
+        lst = []
+        with self.lock_records: lst_aggs = list(self.dict_err_aggs.values())
+        for agg in lst_aggs:
+            line = agg.msg_base + ' (' + str(agg.Locn) + ' ' + \
+                    str(agg.iCodeReport) + '): ' + str(agg.count)
+            if len(agg.lst_params) > 0:
+                line += '; e.g. ' + ', '.join(str(p).strip() for p in agg.lst_params)
+            lst.append(line)
+        summary = '\n'.join(lst)
+
+        if self.IsPrint and (len(summary) > 0): self.WriteReport(summary)
+        return summary
 
     def ResetWarning(self):
         """
@@ -150,7 +783,7 @@ class ErrorHandle:
         self.iCodeLocal = 0
         self.iCodeBase = 0
         self.iCodeReport = 0
-        self.ErrMsg = ''
+        self.lst_err_msg = []
         self.ErrParam = None
         self.IsErr = False
     """
@@ -192,7 +825,9 @@ class ErrorHandle:
     def delete_log_file(self, logger, path_file):
         """
         Delete the current logging file
+        Modified 10/18/26 to first write any queued async report messages
         """
+        flush_async_reports()
         for handler in logger.handlers:
             if isinstance(handler, logging.FileHandler):
 
@@ -206,4 +841,26 @@ class ErrorHandle:
         Re-initialize the log file after deleting it
         """
         handler = logging.FileHandler(path_file)
-        logger.addHandler(handler)
\ No newline at end of file
+        logger.addHandler(handler)
+
+"""
+=========================================================================
+Command line compile of error codes catalog (e.g. ahead of deployment)
+=========================================================================
+"""
+def main(lst_args=None):
+    """
+    Compile error codes file to .pkl sidecar or to path specified with -o
+    JDL 10/18/26
+    """
+    parser = argparse.ArgumentParser(description='Compile error codes catalog')
+    parser.add_argument('path_file', help='ErrorCodes .xlsx, .csv or .json file')
+    parser.add_argument('-o', '--path_out', default=None, \
+                        help='Output .pkl, .csv or .json (default .pkl sidecar)')
+    args = parser.parse_args(lst_args)
+
+    print(compile_err_codes(args.path_file, args.path_out))
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())
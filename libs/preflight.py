@@ -4,19 +4,813 @@
 #                  Add tests of all preflights in test_preflight.py
 #Version 8/29/24 - Set default tbl=None in case using Class to check a df
 #                  without Table instance and its tbl.df attribute
+#Version 10/18/26 - Import openpyxl in CheckExcelFiles.ExcelFileOpens only
+#                   Add nWorkers option to run LstCols checks in parallel
+#                   Add ...Block methods that check a list of columns at once
+#                   Add ColSpec/TableSchema declarative checks (CheckSchema)
+#                   Vectorized regex checks with compiled pattern cache
+#                   Hashed (isin) membership checks reporting all missing vals
+#                   Single-pass duplicate counts in ColContainsNodupsListVals
+#                   Fused min/max range checks with optional violation report
+#                   Add CheckDataFrameChunks streaming checks over df chunks
+#                   Static check Locn names (no frame inspection per call)
+#                   Add IsCollectAll option for collect-all/fail-fast modes
+#                   Add IsViolations columnar violation table with export
+#                   Add IsRowMasks bit-packed row masks of failed checks
+#                   Add CheckDataFrameChunks.CheckIncremental revalidation
+#                   Add CheckResultCache persistent content-hash result cache
+#                   Add sorted and composite-key fast paths for duplicate checks
+#                   Add dtype dispatch for numeric checks; report non-numeric values
+#                   Use pyarrow.compute kernels for Arrow-backed columns
 
 import pandas as pd
+import numpy as np
 import os
-from openpyxl import load_workbook
 import re
+import abc
+import functools
+import weakref
+import inspect
+import hashlib
+import atexit
+import threading
+import collections
+import concurrent.futures
 import util
 from error_handling import ErrorHandle
 
+#pyarrow is optional --only needed for Arrow-backed (pd.ArrowDtype) columns
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa, pc = None, None
+
 #Initialize logging in case needed based on errs IsLog attribute
 import logging
 logger = logging.getLogger(__name__)
 """
 =========================================================================
+Column check functions returning True if a column (Series) passes. These
+are module-level so CheckDataFrame can run them in a thread or process
+pool (nWorkers > 1) as well as from its Col... methods
+=========================================================================
+"""
+def arrow_values(vals):
+    """
+    Return pyarrow array of Series or Index vals if Arrow-backed
+    (pd.ArrowDtype or string[pyarrow]) so checks can run pyarrow.compute
+    kernels without converting to object arrays; otherwise None
+    JDL 10/18/26
+    """
+    if not is_arrow_dtype(vals.dtype): return None
+    return pa.array(vals.array)
+
+def is_arrow_dtype(dtype):
+    """
+    dtype is Arrow-backed and pyarrow is installed (True if so)
+    JDL 10/18/26
+    """
+    if pa is None: return False
+    return isinstance(dtype, pd.ArrowDtype) or \
+        (isinstance(dtype, pd.StringDtype) and dtype.storage.startswith('pyarrow'))
+
+def is_arrow_numeric(arr):
+    """
+    pyarrow array has an integer, floating or decimal type (True if so)
+    JDL 10/18/26
+    """
+    return pa.types.is_integer(arr.type) or pa.types.is_floating(arr.type) or \
+        pa.types.is_decimal(arr.type)
+
+def is_arrow_string(arr):
+    """
+    pyarrow array has a string type (True if so)
+    JDL 10/18/26
+    """
+    return pa.types.is_string(arr.type) or pa.types.is_large_string(arr.type)
+
+#Regex syntax whose meaning differs between Python re and Arrow's RE2
+#engine: \s (re also matches \x1c-\x1f), POSIX [:class:] and inline flags
+rgx_re2_unsafe = re.compile(r'\\[sS]|\[:|\(\?[aiLmsux-]+[:)]')
+
+def is_arrow_regex_safe(arr, str_regex, IgnoreCase=False):
+    """
+    True if Arrow's RE2 match of string arr values gives the same result as
+    re.match. Unicode digit/word classes and case folding agree only for
+    ASCII patterns and data; re's $ also matches before a trailing newline
+    JDL 10/18/26
+    """
+    if (not str_regex.isascii()) or rgx_re2_unsafe.search(str_regex): return False
+    if IgnoreCase or re.search(r'\\[dDwWbB]', str_regex):
+        if not pc.all(pc.string_is_ascii(arr)).as_py(): return False
+    if '$' in str_regex:
+        if pc.any(pc.ends_with(arr, pattern='\n')).as_py(): return False
+    return True
+
+def arrow_regex_match(ser, arr, str_regex, IgnoreCase=False):
+    """
+    Return pyarrow bool array True where string arr values (of ser) match
+    str_regex at their start, the same as re.match of ser.astype(str)
+    values; None if that can't be assured (see is_arrow_regex_safe) or the
+    pattern is not supported by RE2
+    JDL 10/18/26; Modified 10/18/26 to match re results exactly
+    """
+    if not is_arrow_regex_safe(arr, str_regex, IgnoreCase): return None
+    try:
+        is_match = pc.match_substring_regex(arr, pattern='^(?:' + str_regex + ')', \
+                                            ignore_case=IgnoreCase)
+    except pa.ArrowInvalid:
+        return None
+    if arr.null_count == 0: return is_match
+
+    # Nulls match as their str (e.g. '<NA>'), as in the re path
+    str_null = pd.Series([None], dtype=ser.dtype).astype(str).iloc[0]
+    is_null_match = compiled_regex(str_regex, IgnoreCase).match(str_null) is not None
+    return pc.fill_null(is_match, is_null_match)
+
+def is_col_populated(ser):
+    """
+    All values in ser are non-null (True if so)
+    JDL 10/18/26
+    """
+    arr = arrow_values(ser)
+    if arr is not None: return arr.null_count == 0
+    return not ser.isna().any()
+
+def is_col_nonblank(ser):
+    """
+    ser contains at least one non-blank value (True if so)
+    JDL 10/18/26
+    """
+    arr = arrow_values(ser)
+    if arr is not None: return arr.null_count < len(arr)
+    return ser.notnull().any()
+
+def is_col_numeric(ser):
+    """
+    Values in ser are non-blank and numeric (True if so). Non-nullable
+    NumPy int/bool dtypes pass without a scan, other numeric dtypes only
+    need a null check; remaining dtypes are coerced to numeric
+    JDL 10/18/26
+    """
+    if is_non_nullable_numeric(ser.dtype): return True
+    arr = arrow_values(ser)
+    if arr is not None and is_arrow_numeric(arr): return arr.null_count == 0
+    if pd.api.types.is_numeric_dtype(ser.dtype): return not ser.isna().any()
+
+    # Convert the column to numeric, coercing non-numeric values to NaN
+    col_numeric = pd.to_numeric(ser, errors='coerce')
+    return not col_numeric.isna().any()
+
+def is_non_nullable_numeric(dtype):
+    """
+    dtype is a NumPy bool or integer dtype, which cannot hold nulls (True if so)
+    JDL 10/18/26
+    """
+    return isinstance(dtype, np.dtype) and dtype.kind in 'biu'
+
+def is_numpy_numeric(ser):
+    """
+    ser has a NumPy bool, integer or float dtype (True if so)
+    JDL 10/18/26
+    """
+    return isinstance(ser.dtype, np.dtype) and ser.dtype.kind in 'biuf'
+
+def is_min_max_in_range(vmin, vmax, llim=None, ulim=None):
+    """
+    Reduced min and max (array or scalar) are within range; NaN fails
+    JDL 10/18/26
+    """
+    is_in_range = np.ones(np.shape(vmin), dtype=bool)
+    if llim is not None: is_in_range &= (vmin >= llim)
+    if ulim is not None: is_in_range &= (vmax <= ulim)
+    return is_in_range
+
+def is_col_in_numeric_range(ser, llim=None, ulim=None):
+    """
+    ser values (must be numeric) are within specified range (True if so).
+    NumPy numeric dtypes are checked with min/max reductions (no temporary
+    boolean Series); a NaN propagates to min/max and fails as before
+    JDL 10/18/26
+    """
+    if len(ser) == 0: return True
+    if is_numpy_numeric(ser):
+        vals = ser.to_numpy()
+        return bool(is_min_max_in_range(vals.min(), vals.max(), llim, ulim))
+
+    # Arrow-backed numeric column --one min_max kernel; nulls and NaN fail
+    arr = arrow_values(ser)
+    if arr is not None and is_arrow_numeric(arr):
+        if arr.null_count > 0: return False
+        if pa.types.is_floating(arr.type) and pc.any(pc.is_nan(arr)).as_py(): return False
+        vmin_vmax = pc.min_max(arr)
+        return bool(is_min_max_in_range(vmin_vmax['min'].as_py(), \
+                                        vmin_vmax['max'].as_py(), llim, ulim))
+
+    # If llim specified check column values greater than or equal to llim
+    if llim is not None:
+        if not ser.ge(llim).all(): return False
+
+    # If ulim specified check column values less than or equal to ulim
+    if ulim is not None:
+        if not ser.le(ulim).all(): return False
+    return True
+
+def is_col_matching_regex(ser, str_regex, IgnoreCase=False):
+    """
+    ser values all match specified regex pattern (True if so)
+    JDL 10/18/26
+    """
+    return first_regex_mismatch(ser, str_regex, IgnoreCase) is None
+
+#Rows per chunk for vectorized regex matching (allows early exit on mismatch)
+nRowsRegexChunk = 100000
+
+@functools.lru_cache(maxsize=256)
+def compiled_regex(str_regex, IgnoreCase=False):
+    """
+    Return compiled regex pattern (cached across calls and instances)
+    JDL 10/18/26
+    """
+    if IgnoreCase: return re.compile(str_regex, re.IGNORECASE)
+    return re.compile(str_regex)
+
+def values_as_str(ser):
+    """
+    Return ser values as str the same as str(x) of each value. Non-object
+    dtypes (e.g. datetime64, timedelta, float32) format differently with
+    astype(str), so box them to objects first
+    JDL 10/18/26
+    """
+    if ser.dtype == object or pd.api.types.is_string_dtype(ser.dtype):
+        return ser.astype(str)
+    return ser.astype(object).astype(str)
+
+def first_regex_mismatch(ser, str_regex, IgnoreCase=False):
+    """
+    Return position of first ser value (as str) not matching str_regex or
+    None if all match. Matches vectorized chunks with Series.str.match and
+    exits at the first chunk containing a mismatch
+    JDL 10/18/26
+    """
+    # Arrow string column --match_substring_regex kernel, no str boxing
+    arr = arrow_values(ser)
+    if arr is not None and is_arrow_string(arr):
+        is_match = arrow_regex_match(ser, arr, str_regex, IgnoreCase)
+        if is_match is not None:
+            i = pc.index(is_match, False).as_py()
+            return None if i < 0 else i
+
+    pattern = compiled_regex(str_regex, IgnoreCase)
+    for i in range(0, len(ser), nRowsRegexChunk):
+        is_match = values_as_str(ser.iloc[i:i + nRowsRegexChunk]).str.match(pattern)
+        is_match = is_match.to_numpy(dtype=bool)
+        if not is_match.all(): return i + int(np.argmin(is_match))
+    return None
+
+def null_counts(df_block):
+    """
+    Return array of null counts per df_block column. Arrow-backed columns
+    use their stored null count; others one isna pass over the 2-D block
+    JDL 10/18/26
+    """
+    is_arrow = df_block.dtypes.map(is_arrow_dtype).to_numpy(dtype=bool)
+    counts = np.zeros(df_block.shape[1], dtype=np.int64)
+    if not is_arrow.all():
+        counts[~is_arrow] = df_block.loc[:, ~is_arrow].isna().to_numpy().sum(axis=0)
+    for i in np.flatnonzero(is_arrow):
+        counts[i] = arrow_values(df_block.iloc[:, i]).null_count
+    return counts
+
+def lst_cols_with_nulls(df_block):
+    """
+    Return list of df_block columns containing null values (one isna pass)
+    JDL 10/18/26; Modified 10/18/26 to use null_counts
+    """
+    return list(df_block.columns[null_counts(df_block) > 0])
+
+def lst_cols_all_null(df_block):
+    """
+    Return list of df_block columns containing only null values
+    JDL 10/18/26; Modified 10/18/26 to use null_counts
+    """
+    return list(df_block.columns[null_counts(df_block) == len(df_block)])
+
+def lst_cols_non_numeric(df_block):
+    """
+    Return list of df_block columns with null or non-numeric values (same
+    per-column result as is_col_numeric). Numeric dtype columns only need a
+    null check; object columns are coerced to numeric in one pass over
+    their flattened 2-D values; other dtypes (e.g. datetime, category) are
+    checked individually with is_col_numeric
+    JDL 10/18/26; Modified 10/18/26 to match is_col_numeric for other dtypes
+    """
+    dtypes = df_block.dtypes
+    is_num_dtype = dtypes.map(pd.api.types.is_numeric_dtype).to_numpy(dtype=bool)
+    is_object = (dtypes == object).to_numpy(dtype=bool)
+    is_nullable = is_num_dtype & ~dtypes.map(is_non_nullable_numeric).to_numpy(dtype=bool)
+
+    # Null check only for numeric columns that can hold nulls
+    is_fail = np.zeros(df_block.shape[1], dtype=bool)
+    if is_nullable.any():
+        is_fail[is_nullable] = df_block.loc[:, is_nullable].isna().to_numpy().any(axis=0)
+
+    # Coerce object columns as one flattened array
+    if is_object.any():
+        vals = df_block.loc[:, is_object].to_numpy(dtype=object)
+        vals_num = pd.to_numeric(vals.ravel(order='F'), errors='coerce')
+        is_nan = pd.isna(vals_num).reshape(vals.shape, order='F')
+        is_fail[is_object] = is_nan.any(axis=0)
+
+    # Remaining dtypes checked individually
+    for i in np.flatnonzero(~is_num_dtype & ~is_object):
+        is_fail[i] = not is_col_numeric(df_block.iloc[:, i])
+    return list(df_block.columns[is_fail])
+
+def lst_cols_out_of_range(df_block, llim=None, ulim=None):
+    """
+    Return list of df_block columns with values outside range. NumPy
+    numeric columns are reduced together (one min and one max pass over
+    the 2-D block); other columns are checked individually
+    JDL 10/18/26
+    """
+    is_num = np.array([is_numpy_numeric(df_block.iloc[:, i]) \
+                       for i in range(df_block.shape[1])], dtype=bool)
+    is_fail = np.zeros(df_block.shape[1], dtype=bool)
+    if is_num.any() and len(df_block) > 0:
+        vals = df_block.loc[:, is_num].to_numpy()
+        is_fail[is_num] = ~is_min_max_in_range(vals.min(axis=0), \
+                                               vals.max(axis=0), llim, ulim)
+    for i in np.flatnonzero(~is_num):
+        is_fail[i] = not is_col_in_numeric_range(df_block.iloc[:, i], llim, ulim)
+    return list(df_block.columns[is_fail])
+
+def mask_out_of_range(ser, llim=None, ulim=None):
+    """
+    Return bool array True for ser values outside range (or null)
+    JDL 10/18/26
+    """
+    is_in_range = pd.Series(True, index=ser.index)
+    if llim is not None: is_in_range &= ser.ge(llim)
+    if ulim is not None: is_in_range &= ser.le(ulim)
+    return ~is_in_range.fillna(False).to_numpy(dtype=bool)
+
+def mask_non_numeric(ser):
+    """
+    Return bool array True for ser values that are blank or non-numeric
+    (dispatched by dtype as in is_col_numeric)
+    JDL 10/18/26
+    """
+    if is_non_nullable_numeric(ser.dtype): return np.zeros(len(ser), dtype=bool)
+    if pd.api.types.is_numeric_dtype(ser.dtype): return ser.isna().to_numpy(dtype=bool)
+    return pd.to_numeric(ser, errors='coerce').isna().to_numpy()
+
+def non_numeric_vals(ser, nViolations=5):
+    """
+    Return list of first nViolations distinct non-blank, non-numeric ser
+    values and count of blank values (for reporting failed numeric checks)
+    JDL 10/18/26
+    """
+    is_bad = mask_non_numeric(ser)
+    is_blank = ser.isna().to_numpy(dtype=bool) & is_bad
+    vals_bad = pd.unique(ser.to_numpy()[is_bad & ~is_blank])
+    return list(vals_bad[:nViolations]), int(is_blank.sum())
+
+def mask_regex_mismatch(ser, str_regex, IgnoreCase=False):
+    """
+    Return bool array True for ser values (as str) not matching str_regex
+    JDL 10/18/26
+    """
+    arr = arrow_values(ser)
+    if arr is not None and is_arrow_string(arr):
+        is_match = arrow_regex_match(ser, arr, str_regex, IgnoreCase)
+        if is_match is not None: return ~np.asarray(is_match, dtype=bool)
+
+    pattern = compiled_regex(str_regex, IgnoreCase)
+    return ~values_as_str(ser).str.match(pattern).to_numpy(dtype=bool)
+
+def range_violations(ser, llim=None, ulim=None, nViolations=5):
+    """
+    Return ser's observed min, max and list of first nViolations index
+    labels of values outside range (for reporting failed range checks)
+    JDL 10/18/26
+    """
+    is_out = mask_out_of_range(ser, llim, ulim)
+    return ser.min(), ser.max(), list(ser.index[is_out][:nViolations])
+
+def lst_missing_vals(list_vals, vals):
+    """
+    Return list of list_vals items not present in vals (array, Series or
+    Index). If vals is a unique Index, its cached hash engine is used;
+    otherwise membership is one hashed isin pass over vals
+    JDL 10/18/26
+    """
+    arr_vals = np.empty(len(list_vals), dtype=object)
+    arr_vals[:] = list(list_vals)
+
+    # MultiIndex membership also matches partial keys --keep scalar lookups
+    if isinstance(vals, pd.MultiIndex):
+        return [val for val in arr_vals if val not in vals]
+
+    # Arrow-backed vals --is_in kernel if list_vals convert to vals' type
+    arr = arrow_values(vals) if isinstance(vals, (pd.Series, pd.Index)) else None
+    if arr is not None:
+        try:
+            value_set = arr.combine_chunks() if isinstance(arr, pa.ChunkedArray) else arr
+            is_present = pc.is_in(pa.array(list(arr_vals), type=arr.type), value_set=value_set)
+            return list(arr_vals[~np.asarray(is_present, dtype=bool)])
+        except (pa.ArrowException, TypeError, ValueError):
+            pass
+    if isinstance(vals, pd.Index) and vals.is_unique:
+        is_present = vals.get_indexer(pd.Index(arr_vals)) >= 0
+    else:
+        is_present = pd.Series(arr_vals).isin(vals).to_numpy()
+    return list(arr_vals[~is_present])
+
+def ser_dup_counts(ser, list_vals):
+    """
+    Return Series of row counts for list_vals values occurring more than
+    once in ser (one isin pass, then value_counts of the matching rows)
+    JDL 10/18/26
+    """
+    counts = ser[ser.isin(list_vals)].value_counts(sort=False)
+    return counts[counts > 1]
+
+def value_hashes(vals):
+    """
+    Return uint64 hash per value (row) of Series, Index or DataFrame vals.
+    hash_pandas_object hashes mixed object values by str, so object (and
+    object-category) columns also hash each value's type --1 and '1' differ
+    JDL 10/18/26
+    """
+    hashes = pd.util.hash_pandas_object(vals, index=False).to_numpy()
+    lst_sers = [vals.iloc[:, i] for i in range(vals.shape[1])] \
+        if isinstance(vals, pd.DataFrame) else [vals]
+    for ser in lst_sers:
+        dtype = ser.dtype
+        if isinstance(dtype, pd.CategoricalDtype): dtype = dtype.categories.dtype
+        if dtype != object: continue
+        arr_types = np.array([type(val).__qualname__ for val in np.asarray(ser, dtype=object)], \
+                             dtype=object)
+        hashes = hashes * np.uint64(31) + pd.util.hash_array(arr_types)
+    return hashes
+
+nRowsSortedProbe = 1024 # Leading values compared before a full sorted pass
+
+def is_strict_monotonic(arr):
+    """
+    True if 1-D numeric or datetime ndarray is strictly increasing or
+    decreasing (so unique). A leading probe skips the full adjacent
+    comparison for unsorted arrays
+    JDL 10/18/26
+    """
+    if arr.ndim != 1 or arr.dtype.kind not in 'iufmM': return False
+    if len(arr) < 2: return True
+    probe = arr[:nRowsSortedProbe]
+    if (probe[1:] > probe[:-1]).all():
+        return bool((arr[1:] > arr[:-1]).all())
+    if (probe[1:] < probe[:-1]).all():
+        return bool((arr[1:] < arr[:-1]).all())
+    return False
+
+def is_unique_vals(vals):
+    """
+    True if Index or Series vals has no duplicates. Sorted values are
+    settled by a linear adjacent comparison (for an Index, the engine's
+    cached monotonic check) before falling back to a hash table
+    JDL 10/18/26
+    """
+    if isinstance(vals, pd.Index):
+        # Engine's monotonic check also caches is_unique if strictly sorted
+        _ = vals.is_monotonic_increasing
+        return vals.is_unique
+    if isinstance(vals.dtype, np.dtype) and is_strict_monotonic(vals.to_numpy()): return True
+    return vals.is_unique
+
+def is_unique_rows(df_keys):
+    """
+    True if rows of df_keys (composite key columns) are unique. Rows are
+    hashed in one vectorized pass; rows are compared exactly only if
+    hashes repeat
+    JDL 10/18/26
+    """
+    hashes = pd.util.hash_pandas_object(df_keys, index=False).to_numpy()
+    if len(pd.unique(hashes)) == len(hashes): return True
+    return not df_keys.duplicated().any()
+"""
+=========================================================================
+Violation table. If CheckDataFrame.IsViolations, each recorded error also
+adds rows to a columnar table (one row per violating df row where the
+check identifies rows, otherwise one per offending value or column) so
+results can be stored and queried without parsing message strings
+=========================================================================
+"""
+lst_violation_cols = ['table', 'column', 'check', 'iCodeReport', 'row', 'value']
+
+def write_violations(df_viol, path_out):
+    """
+    Write violation table to .parquet (requires pyarrow or fastparquet) or
+    .csv (True if written). Write failures and a missing parquet engine
+    are logged, not raised
+    JDL 10/18/26
+    """
+    ext = os.path.splitext(path_out)[1].lower()
+    try:
+        if ext == '.parquet':
+            # row and value columns hold mixed types --store as strings
+            df_viol = df_viol.astype({'row':str, 'value':str})
+            df_viol.to_parquet(path_out, index=False)
+        else:
+            df_viol.to_csv(path_out, index=False)
+        return True
+    except OSError:
+        logger.warning('Could not write violations file: ' + path_out)
+        return False
+    except ImportError:
+        logger.warning('No parquet engine (pyarrow or fastparquet) to write: ' + path_out)
+        return False
+"""
+=========================================================================
+Persistent check result cache. A CheckResultCache stores keys of passing
+checks --a digest of the check name, its parameters and a content hash
+(value_hashes, which includes object value types) of the df data it
+reads-- in a text file (one hex key per line, least recently used first)
+with least-recently-used eviction. CheckDataFrame methods decorated with
+@cached_check return True without rerunning for unchanged data if the
+instance's .result_cache is set. Failing checks are not cached, so their
+errors are always reported in full
+=========================================================================
+"""
+class CheckResultCache:
+    def __init__(self, path_dir, nMaxEntries=100000, f_cache='check_results.txt'):
+        """
+        Initialize cache stored in path_dir/f_cache (loaded if it exists)
+        JDL 10/18/26
+        """
+        self.path_file = os.path.join(path_dir, f_cache)
+        self.nMaxEntries = nMaxEntries
+        self.dict_keys = collections.OrderedDict() # key -> True; oldest first
+        self.lock = threading.Lock()
+        self.IsDirty = False # True if keys added or evicted since last .Save
+        self.nHits, self.nMisses = 0, 0
+        self.Load()
+        atexit.register(self.Save)
+
+    def Load(self):
+        """
+        Load cached keys from .path_file (empty cache if missing or
+        unreadable); lines that are not hex keys are ignored
+        JDL 10/18/26
+        """
+        if not os.path.isfile(self.path_file): return
+        try:
+            with open(self.path_file, encoding='ascii') as f: lst_lines = f.read().split()
+        except (OSError, UnicodeDecodeError):
+            logger.warning('Could not read check result cache: ' + self.path_file)
+            return
+        self.dict_keys = collections.OrderedDict((key, True) for key in lst_lines \
+                                                 if re.fullmatch('[0-9a-f]+', key))
+
+    def Save(self):
+        """
+        Write cached keys to .path_file if keys were added or evicted
+        (atomic replace); write failures are logged, not raised. Also runs
+        at exit
+        JDL 10/18/26
+        """
+        with self.lock:
+            if not self.IsDirty: return
+            path_tmp = self.path_file + '.tmp' + str(os.getpid())
+            try:
+                with open(path_tmp, 'w', encoding='ascii') as f:
+                    f.write(''.join(key + '\n' for key in self.dict_keys))
+                os.replace(path_tmp, self.path_file)
+                self.IsDirty = False
+            except OSError:
+                logger.warning('Could not write check result cache: ' + self.path_file)
+
+    def IsPass(self, key):
+        """
+        True if key is a cached passing result (marks it recently used; the
+        new order is saved with the next added key, so hits alone don't
+        rewrite the file)
+        JDL 10/18/26
+        """
+        with self.lock:
+            if not key in self.dict_keys:
+                self.nMisses += 1
+                return False
+            self.dict_keys.move_to_end(key)
+            self.nHits += 1
+            return True
+
+    def AddPass(self, key):
+        """
+        Add passing result key; evict least recently used beyond nMaxEntries
+        JDL 10/18/26
+        """
+        with self.lock:
+            self.dict_keys[key] = True
+            self.dict_keys.move_to_end(key)
+            while len(self.dict_keys) > self.nMaxEntries: self.dict_keys.popitem(last=False)
+            self.IsDirty = True
+
+    def Clear(self):
+        """
+        Remove all cached results (and cache file)
+        JDL 10/18/26
+        """
+        with self.lock:
+            self.dict_keys = collections.OrderedDict()
+            self.IsDirty = False
+            if os.path.isfile(self.path_file): os.remove(self.path_file)
+
+def content_key(lst_items):
+    """
+    Return hex digest of lst_items --pandas objects by dtype, length and
+    value_hashes (values and, for object columns, their types); other items
+    by repr
+    JDL 10/18/26
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for item in lst_items:
+        if isinstance(item, pd.DataFrame):
+            digest.update((repr(list(item.columns)) + str(list(item.dtypes))).encode())
+            digest.update(value_hashes(item).tobytes())
+        elif isinstance(item, (pd.Series, pd.Index)):
+            digest.update((str(item.dtype) + ':' + str(len(item))).encode())
+            digest.update(value_hashes(item).tobytes())
+        else:
+            digest.update(repr(item).encode())
+    return digest.hexdigest()
+
+def cached_check(fn_data):
+    """
+    Decorator for CheckDataFrame check methods with a df arg. If
+    .result_cache is set, a check that passed before for the same args and
+    data returns True without rerunning. fn_data(self, df, dict_args)
+    returns the list of pandas objects (or values) the check reads
+    JDL 10/18/26
+    """
+    def decorator(fn_check):
+        sig = inspect.signature(fn_check)
+
+        @functools.wraps(fn_check)
+        def wrapper(self, *args, **kwargs):
+            if self.result_cache is None: return fn_check(self, *args, **kwargs)
+
+            # Key from check name, args (except df) and content of data read
+            bound = sig.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            dict_args = {k:v for k, v in bound.arguments.items() if not k in ['self', 'df']}
+            df = self.CheckedDf(bound.arguments['df'])
+            try:
+                key = content_key([fn_check.__name__, sorted(dict_args.items(), key=str)] + \
+                                  fn_data(self, df, dict_args))
+            except TypeError:
+                return fn_check(self, *args, **kwargs) # Unhashable data --run uncached
+
+            if self.result_cache.IsPass(key): return True
+            is_pass = fn_check(self, *args, **kwargs)
+            if is_pass: self.result_cache.AddPass(key)
+            return is_pass
+        return wrapper
+    return decorator
+"""
+=========================================================================
+Declarative validation schema. A TableSchema holds ColSpec column specs
+(required, numeric, range, regex, populated, nonblank, unique). Its
+.CompilePlan merges specs by column so CheckDataFrame.CheckSchema reads
+each column once and shares intermediate results (null mask, numeric
+conversion) across that column's checks. Failures are reported with
+the error codes of the equivalent CheckDataFrame method (dict_check_codes)
+=========================================================================
+"""
+#Check name -> (local error code, CheckDataFrame method name for code lookup)
+dict_check_codes = {'required':(1, 'ContainsRequiredCols'), \
+                    'populated':(4, 'ColPopulated'), \
+                    'nonblank':(7, 'ColNonBlank'), \
+                    'numeric':(8, 'ColNumeric'), \
+                    'range':(9, 'ColValsInNumericRange'), \
+                    'regex':(10, 'ColValsMatchRegex'), \
+                    'unique':(14, 'NoDuplicateColVals')}
+
+class ColSpec:
+    def __init__(self, name, IsRequired=True, IsNumeric=False, IsPopulated=False, \
+                 IsNonBlank=False, llim=None, ulim=None, str_regex=None, \
+                 IgnoreCase=False, IsUnique=False):
+        """
+        Checks to apply to one column
+        JDL 10/18/26
+        """
+        self.name = name
+        self.IsRequired = IsRequired
+        self.IsNumeric = IsNumeric
+        self.IsPopulated = IsPopulated
+        self.IsNonBlank = IsNonBlank
+        self.llim, self.ulim = llim, ulim # Optional numeric range limits
+        self.lst_regex = [] # List of (str_regex, IgnoreCase) patterns to match
+        if str_regex is not None: self.lst_regex.append((str_regex, IgnoreCase))
+        self.IsUnique = IsUnique
+
+    def Merge(self, spec):
+        """
+        Combine another spec for the same column into this one
+        JDL 10/18/26
+        """
+        for att in ['IsRequired', 'IsNumeric', 'IsPopulated', 'IsNonBlank', 'IsUnique']:
+            setattr(self, att, getattr(self, att) or getattr(spec, att))
+
+        # Keep tighter of range limits
+        if spec.llim is not None:
+            self.llim = spec.llim if self.llim is None else max(self.llim, spec.llim)
+        if spec.ulim is not None:
+            self.ulim = spec.ulim if self.ulim is None else min(self.ulim, spec.ulim)
+        for regex in spec.lst_regex:
+            if not regex in self.lst_regex: self.lst_regex.append(regex)
+
+class TableSchema:
+    def __init__(self, lst_specs=None):
+        """
+        List of ColSpec column specs for a table
+        JDL 10/18/26
+        """
+        self.lst_specs = [] if lst_specs is None else list(lst_specs)
+
+    def AddCol(self, name, **kwargs):
+        """
+        Add ColSpec for column name (kwargs as in ColSpec)
+        JDL 10/18/26
+        """
+        self.lst_specs.append(ColSpec(name, **kwargs))
+
+    def SetFromTable(self, tbl):
+        """
+        Add specs from Table required, numeric, populated and nonblank lists
+        JDL 10/18/26
+        """
+        for col in tbl.required_cols: self.AddCol(col)
+        for col in tbl.numeric_cols: self.AddCol(col, IsNumeric=True)
+        for col in tbl.populated_cols: self.AddCol(col, IsPopulated=True)
+        for col in tbl.nonblank_cols: self.AddCol(col, IsNonBlank=True)
+
+    def CompilePlan(self):
+        """
+        Return list of merged ColSpecs --one per column in order of first spec
+        JDL 10/18/26
+        """
+        dict_plan = {}
+        for spec in self.lst_specs:
+            if spec.name in dict_plan:
+                dict_plan[spec.name].Merge(spec)
+            else:
+                dict_plan[spec.name] = ColSpec(spec.name, IsRequired=False)
+                dict_plan[spec.name].Merge(spec)
+        return list(dict_plan.values())
+
+def lst_col_spec_fails(ser, spec):
+    """
+    Return list of names of spec's checks that ser fails (in dict_check_codes
+    order). Null mask and numeric conversion are computed once and shared
+    JDL 10/18/26
+    """
+    lst_fails = []
+    IsRange = (spec.llim is not None) or (spec.ulim is not None)
+    has_nulls = None
+    if spec.IsPopulated or spec.IsNonBlank or spec.IsNumeric or IsRange:
+        is_null = ser.isna()
+        has_nulls = is_null.any()
+
+    if spec.IsPopulated and has_nulls: lst_fails.append('populated')
+    if spec.IsNonBlank and is_null.all(): lst_fails.append('nonblank')
+
+    # Numeric check (convert non-numeric dtypes once for numeric and range)
+    ser_num = ser if pd.api.types.is_numeric_dtype(ser) else None
+    if spec.IsNumeric:
+        if ser_num is None: ser_num = pd.to_numeric(ser, errors='coerce')
+        if has_nulls or ser_num.isna().any(): lst_fails.append('numeric')
+
+    # Range check with min/max (values must be non-null as in ge/le check)
+    if IsRange:
+        if ser_num is None:
+            is_in_range = is_col_in_numeric_range(ser, spec.llim, spec.ulim)
+        else:
+            is_in_range = not ser_num.isna().any()
+            if is_in_range and (spec.llim is not None): 
+                is_in_range = ser_num.min() >= spec.llim
+            if is_in_range and (spec.ulim is not None): 
+                is_in_range = ser_num.max() <= spec.ulim
+        if not is_in_range: lst_fails.append('range')
+
+    for str_regex, IgnoreCase in spec.lst_regex:
+        if not is_col_matching_regex(ser, str_regex, IgnoreCase):
+            lst_fails.append('regex')
+            break
+    if spec.IsUnique and not is_unique_vals(ser): lst_fails.append('unique')
+    return lst_fails
+"""
+=========================================================================
 This class checks a projfiles.tbl.df (Table class df attribute) structure   
 and datavalues based on specified Table attributes such as a list of 
 required columns and the .df's default index
@@ -24,6 +818,12 @@ required columns and the .df's default index
 In alternate usage, df can be passed as an argument directly -- bypassing
 use of the Table class to check df instead of self.tbl.df
 
+If nWorkers > 1, LstCols... methods evaluate their columns concurrently
+in a thread pool (or a process pool if IsProcessPool --e.g. for regex
+checks that hold the GIL). The error for the first failing column in
+list order is then recorded, so results match serial execution. An
+existing executor can be passed to share one pool across instances.
+
 The class relies on default or custom error codes in ErrorCodes.xlsx
 whose df is an attribute of the .errs ErrorHandle instance. If 
 .IsCustomCodes is True, the .errs.Locn attribute is used to look up a
@@ -33,10 +833,15 @@ the preflight.py method name is used to look up the default error code..
 """
 class CheckDataFrame:
     def __init__(self, path_err_codes, tbl=None, IsCustomCodes=False, \
-                 IsPrint=True, IsLog=False):
+                 IsPrint=True, IsLog=False, nWorkers=1, IsProcessPool=False, \
+                 executor=None, IsCacheIndex=False, IsCollectAll=None, \
+                 IsViolations=False, IsRowMasks=False, result_cache=None):
         """
         Initialize CheckDataFrame
         JDL 2/16/24; Modified 8/29/24 to set default tbl=None
+        Modified 10/18/26 to add nWorkers, IsProcessPool, executor,
+        IsCacheIndex, IsCollectAll, IsViolations, IsRowMasks and
+        result_cache args
         """
         self.tbl = tbl
         self.IsPrint = IsPrint
@@ -46,32 +851,206 @@ class CheckDataFrame:
         #If enabled, will not override errs.Locn with function name for code lookup
         self.IsCustomCodes = IsCustomCodes 
 
+        #Optional parallel evaluation of LstCols... column checks
+        self.nWorkers = nWorkers
+        self.IsProcessPool = IsProcessPool
+        self.executor = executor # Created on first use if None and nWorkers > 1
+        self.IsOwnExecutor = False # True if executor created by this instance
+
+        #Execution mode: True to check every column and report all failures;
+        #False to stop at the first failure; None for each method's default
+        #(LstCols... and ContainsRequiredCols fail fast; CheckSchema and
+        #CheckDataFrameChunks.CheckChunks collect all)
+        self.IsCollectAll = IsCollectAll
+
+        #Columns that failed the latest LstCols..., ...Block or schema check
+        self.lst_cols_failed = []
+
+        #Optional violation table rows (DataFrames) added by failed checks
+        self.IsViolations = IsViolations
+        self.lst_violations = []
+
+        #Optional row masks of failed row-level checks --key (check Locn, col):
+        #np.packbits of bool mask (True = violating row); .nRowsMasked rows
+        self.IsRowMasks = IsRowMasks
+        self.dict_row_masks = {}
+        self.nRowsMasked = None
+
+        #Optional CheckResultCache (may be shared) for @cached_check methods
+        self.result_cache = result_cache
+
+        #Optional cache of hashed column value indexes for ColContainsListVals
+        #(key: (id(df), col_name); call .ClearValsIndexCache after in-place edits)
+        self.IsCacheIndex = IsCacheIndex
+        self.dict_vals_index = {}
+
+    def ColValsIndex(self, df, col_name):
+        """
+        Return unique Index of df[col_name] values for hashed membership
+        lookups --reused across calls for the same df if .IsCacheIndex
+        JDL 10/18/26
+        """
+        if not self.IsCacheIndex: return pd.Index(pd.unique(df[col_name]))
+
+        # Reuse cached index if df is the same live object with same length
+        key = (id(df), col_name)
+        entry = self.dict_vals_index.get(key)
+        if entry is not None and entry[0]() is df and entry[1] == len(df):
+            return entry[2]
+        idx_vals = pd.Index(pd.unique(df[col_name]))
+        self.dict_vals_index[key] = (weakref.ref(df), len(df), idx_vals)
+        return idx_vals
+
+    def ClearValsIndexCache(self):
+        """
+        Clear cached column value indexes (e.g. after modifying a df in place)
+        JDL 10/18/26
+        """
+        self.dict_vals_index = {}
+
+    def GetExecutor(self):
+        """
+        Return executor for parallel column checks (create if needed)
+        JDL 10/18/26
+        """
+        if self.executor is None:
+            if self.IsProcessPool:
+                self.executor = concurrent.futures.ProcessPoolExecutor(self.nWorkers)
+            else:
+                self.executor = concurrent.futures.ThreadPoolExecutor(self.nWorkers)
+            self.IsOwnExecutor = True
+        return self.executor
+
+    def ShutdownExecutor(self):
+        """
+        Shut down executor if created by this instance
+        JDL 10/18/26
+        """
+        if self.IsOwnExecutor: self.executor.shutdown()
+        self.executor, self.IsOwnExecutor = None, False
+
+    def FailingCols(self, fn_check, df, lst_cols, *args):
+        """
+        Return list of lst_cols for which fn_check(df[col], *args) is False
+        --evaluating columns in parallel
+        JDL 10/18/26
+        """
+        lst_sers = [df[col] for col in lst_cols]
+        lst_args = [[arg] * len(lst_cols) for arg in args]
+        lst_is_pass = self.GetExecutor().map(fn_check, lst_sers, *lst_args)
+        return [col for col, is_pass in zip(lst_cols, lst_is_pass) if not is_pass]
+
+    def IsFailFast(self, IsDefault=True):
+        """
+        True if checks stop at their first failure (per .IsCollectAll or, if
+        that is None, the calling method's IsDefault)
+        JDL 10/18/26
+        """
+        if self.IsCollectAll is None: return IsDefault
+        return not self.IsCollectAll
+
+    def CheckEachCol(self, fn_col_check, lst_cols, **kwargs):
+        """
+        Run a Col... check method on each of lst_cols --stopping at the first
+        failure unless collect-all. Sets .lst_cols_failed (True if all pass)
+        JDL 10/18/26
+        """
+        IsFailFast = self.IsFailFast()
+        self.lst_cols_failed = []
+        for col in lst_cols:
+
+            # Reset errs after a reported failure so next one is also reported
+            if len(self.lst_cols_failed) > 0: self.errs.ResetWarning()
+            if fn_col_check(col, **kwargs): continue
+            self.lst_cols_failed.append(col)
+            if IsFailFast: break
+        return len(self.lst_cols_failed) == 0
+
+    def IsParallel(self, lst_cols):
+        """
+        True if LstCols... check of lst_cols should run in parallel
+        JDL 10/18/26
+        """
+        return (self.nWorkers > 1) and (len(lst_cols) > 1)
+
+    def CheckedDf(self, df):
+        """
+        Return df arg if supplied, otherwise .tbl.df
+        JDL 10/18/26
+        """
+        if df is None: return self.tbl.df
+        return df
+
+    def CheckSchema(self, schema=None, df=None):
+        """
+        Check df against a TableSchema in one pass per column; report every
+        failing column/check (True if all pass). Default schema is
+        .tbl.schema or one built from .tbl column lists (ValueError if no
+        schema and no .tbl). If fail-fast (.IsCollectAll False), stops at
+        and reports the first failure
+        JDL 10/18/26
+        """
+        df = self.CheckedDf(df)
+        if schema is None: schema = getattr(self.tbl, 'schema', None)
+        if schema is None:
+            if self.tbl is None:
+                raise ValueError('CheckSchema requires a schema arg if CheckDataFrame has no tbl')
+            schema = TableSchema()
+            schema.SetFromTable(self.tbl)
+
+        #Missing required columns (their other checks are skipped)
+        lst_plan = schema.CompilePlan()
+        dict_fails = {check:[] for check in dict_check_codes}
+        dict_fails['required'] = [spec.name for spec in lst_plan \
+                                  if spec.IsRequired and not spec.name in df.columns]
+
+        #Evaluate each present column's checks; collect failing columns by check
+        IsFailFast = self.IsFailFast(False)
+        for spec in lst_plan:
+            if IsFailFast and any(dict_fails.values()): break
+            if not spec.name in df.columns: continue
+            for check in lst_col_spec_fails(df[spec.name], spec):
+                dict_fails[check].append(spec.name)
+
+        #Record one error per failing check listing its columns (reset errs
+        #between reports so each message is reported once)
+        is_pass = True
+        for check, lst_failed in dict_fails.items():
+            if len(lst_failed) == 0: continue
+            if IsFailFast and not is_pass: break
+            if IsFailFast: lst_failed[1:] = []
+            if not is_pass: self.errs.ResetWarning()
+            is_pass = self.ReportFailedCols(lst_failed, *dict_check_codes[check])
+        lst_cols = [col for lst in dict_fails.values() for col in lst]
+        self.lst_cols_failed = list(dict.fromkeys(lst_cols))
+        return is_pass
+
+    @cached_check(lambda self, df, a: [df.columns, getattr(self.tbl, 'required_cols', None) \
+                                       if a['cols_req'] is None else None])
     def ContainsRequiredCols(self, cols_req=None, df=None):
         """
         .tbl.df contains specified list of column names (True if so)
         JDL 2/16/24; Modified 8/27/24 to add df arg
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
         #Enable override list of required columns list
         if cols_req is None: cols_req = self.tbl.required_cols
 
-        #Check df has all required columns
-        for col in cols_req:
-            if self.errs.is_fail((not col in df.columns), 1, self.errs.Locn, col):
-                self.errs.RecordErr()
-                return False
-        return True
+        #Check df has all required columns (report all missing if collect-all)
+        lst_missing = [col for col in cols_req if not col in df.columns]
+        if len(lst_missing) == 0: return True
+        if self.IsFailFast(): lst_missing = lst_missing[:1]
+        return self.ReportFailedCols(lst_missing, 1, 'ContainsRequiredCols')
     
+    @cached_check(lambda self, df, a: [df.columns])
     def NoDuplicateCols(self, df=None):
         """
         .tbl.df has unique column names (True if so)
         JDL 2/16/24; Modified 8/27/24 to add df arg
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
         #Check if there are true duplicate column names
@@ -79,8 +1058,7 @@ class CheckDataFrame:
         if not cols.is_unique: 
             duplicates = cols[cols.duplicated()].unique()
             ErrParam = '\nDuplicate columns: ' + ', '.join(map(str, duplicates))
-            if self.errs.is_fail(True, 2, self.errs.Locn, ErrParam): self.errs.RecordErr()
-            return False
+            return self.RecordCheckErr(2, 'NoDuplicateCols', ErrParam, col=list(duplicates))
         
         #Look for Pandas modified names from pd.read_excel (e.g. .1, .2, etc.)
         else:
@@ -89,275 +1067,895 @@ class CheckDataFrame:
                 scol = str(col)
                 if '.' in scol and scol.rsplit('.', 1)[1].isdigit():
                     ErrParam = scol.split('.')[0]
-                    if self.errs.is_fail(True, 2, self.errs.Locn, ErrParam): self.errs.RecordErr()
-                    return False
+                    return self.RecordCheckErr(2, 'NoDuplicateCols', ErrParam, col=col)
                 
         #No duplicates detected
         return True
 
+    @cached_check(lambda self, df, a: [df.index])
     def NoDuplicateIndices(self, df=None):
         """
         .tbl.df has unique index values (True if so)
-        JDL 2/16/24; Modified 8/27/24 to add df arg
+        JDL 2/16/24; Modified 8/27/24 to add df arg; 10/18/26 sorted fast path
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
         idx = df.index
-        if idx.is_unique: return True
+        if is_unique_vals(idx): return True
 
         #Report duplicate index values
         duplicates = idx[idx.duplicated()].unique()
         ErrParam = '\nDuplicate indices: ' + ', '.join(map(str, duplicates))
-        if self.errs.is_fail(True, 3, self.errs.Locn, ErrParam): self.errs.RecordErr()
-        return False
+        ser_idx = idx.to_series()
+        return self.RecordCheckErr(3, 'NoDuplicateIndices', ErrParam, ser=ser_idx, \
+                                   fn_mask=lambda: idx.duplicated(keep=False))
 
     def LstColsPopulated(self, df=None, lst_cols=None):
         """
         .tbl.df list of tbl.populated_cols populated with non-blank values (True if so)
-        JDL 2/16/24; Modified 8/27/24 to add df and lst_cols args
+        JDL 2/16/24; Modified 8/27/24 to add df and lst_cols args; 10/18/26 parallel
         """
         #list to check is tbl attribute unless overridden by args
         if lst_cols is None: lst_cols = self.tbl.populated_cols
 
-        for col in lst_cols:
-            if not self.ColPopulated(col, df=df): return False
-        return True
+        #If parallel, find failing columns first and record their errors
+        if self.IsParallel(lst_cols):
+            lst_cols = self.FailingCols(is_col_populated, self.CheckedDf(df), lst_cols)
+        return self.CheckEachCol(self.ColPopulated, lst_cols, df=df)
 
+    def LstColsPopulatedBlock(self, df=None, lst_cols=None):
+        """
+        List of columns all populated with non-blank values (True if so).
+        Checks df[lst_cols] in one pass and reports every failing column
+        JDL 10/18/26
+        """
+        if lst_cols is None: lst_cols = self.tbl.populated_cols
+        df = self.CheckedDf(df)
+
+        self.lst_cols_failed = lst_cols_with_nulls(df[lst_cols])
+        return self.ReportFailedCols(self.lst_cols_failed, 4, 'ColPopulated')
+
+    def ReportFailedCols(self, lst_failed, i_code, Locn, sep=', ', lst_cols=None):
+        """
+        Record one error listing lst_failed columns (True if list is empty).
+        Locn is the Col... method whose error codes apply (unless custom).
+        lst_cols (default lst_failed) are the columns for violation rows
+        JDL 10/18/26
+        """
+        if len(lst_failed) == 0: return True
+        if lst_cols is None: lst_cols = list(lst_failed)
+        return self.RecordCheckErr(i_code, Locn, sep.join(map(str, lst_failed)), \
+                                   col=lst_cols)
+
+    def CheckLocn(self, Locn):
+        """
+        Return Locn for error code lookup: the check's static method name
+        or, if .IsCustomCodes, the preset .errs.Locn
+        JDL 10/18/26
+        """
+        if self.IsCustomCodes: return self.errs.Locn
+        return Locn
+
+    def RecordCheckErr(self, i_code, Locn, ErrParam=None, col=None, ser=None, \
+                       fn_mask=None, vals=None):
+        """
+        Record a failed check's error and return False. Locn is resolved
+        here (only on failure) rather than by frame inspection on every call.
+        If .IsViolations, col/ser/fn_mask/vals args add violation table rows
+        JDL 10/18/26
+        """
+        if self.errs.is_fail(True, i_code, self.CheckLocn(Locn), ErrParam):
+
+            # Row mask computed only if collecting violations or row masks
+            mask = None
+            if (fn_mask is not None) and (self.IsViolations or self.IsRowMasks):
+                mask = np.asarray(fn_mask(), dtype=bool)
+                if self.IsRowMasks: self.AddRowMask(col, mask)
+            if self.IsViolations: self.AddViolations(col, ser, mask, vals)
+            self.errs.RecordErr()
+        return False
+
+    def AddViolations(self, col=None, ser=None, mask=None, vals=None):
+        """
+        Add violation rows for the failed check at .errs.Locn: one per True
+        position of bool mask of ser (index label and value); otherwise one
+        per vals item (offending value); otherwise one per column in col
+        (str or list)
+        JDL 10/18/26
+        """
+        self.errs.GetBaseErrCode()
+        self.errs.SetReportErrCode()
+        if mask is not None:
+            is_viol = mask
+            rows, values = list(ser.index[is_viol]), list(ser.to_numpy()[is_viol])
+        elif vals is not None:
+            values = list(vals)
+            rows = [None] * len(values)
+        else:
+            col = col if isinstance(col, list) else [col]
+            rows = values = [None] * len(col)
+
+        df_viol = pd.DataFrame({'row':pd.Series(rows, dtype=object), \
+                                'value':pd.Series(values, dtype=object)})
+        df_viol.insert(0, 'table', '' if self.tbl is None else self.tbl.name)
+        df_viol.insert(1, 'column', pd.Series(col, dtype=object) \
+                       if isinstance(col, list) else col)
+        df_viol.insert(2, 'check', self.errs.Locn)
+        df_viol.insert(3, 'iCodeReport', self.errs.iCodeReport)
+        self.lst_violations.append(df_viol)
+
+    def AddRowMask(self, col, mask):
+        """
+        Store bit-packed bool row mask of failed check at .errs.Locn for col
+        (combined with an existing mask for the same check and column).
+        Masks are for one df's rows; a mask with a different row count (a
+        different df checked) replaces the stored masks
+        JDL 10/18/26; Modified 10/18/26 to reset rather than raise
+        """
+        if mask.size != self.nRowsMasked: self.ClearRowMasks()
+        if self.nRowsMasked is None: self.nRowsMasked = mask.size
+        key = (self.errs.Locn, col)
+        if key in self.dict_row_masks: mask = mask | self.RowMask(key)
+        self.dict_row_masks[key] = np.packbits(mask)
+
+    def RowMask(self, key=None):
+        """
+        Return bool array of violating rows for key (check Locn, col) or, if
+        key is None, rows violating any masked check
+        JDL 10/18/26
+        """
+        if self.nRowsMasked is None: return np.zeros(0, dtype=bool)
+        lst_keys = list(self.dict_row_masks) if key is None else [key]
+        bits = np.zeros((self.nRowsMasked + 7) // 8, dtype=np.uint8)
+        for k in lst_keys: bits |= self.dict_row_masks[k]
+        return np.unpackbits(bits, count=self.nRowsMasked).astype(bool)
+
+    def RowCheckBits(self):
+        """
+        Return unsigned int array per row with bit i set if the row violates
+        the i-th check in .dict_row_masks (key order); up to 64 checks
+        JDL 10/18/26
+        """
+        lst_keys = list(self.dict_row_masks)
+        if len(lst_keys) > 64: raise ValueError('More than 64 masked checks')
+        dtype = np.min_scalar_type((1 << len(lst_keys)) - 1)
+        bits = np.zeros(0 if self.nRowsMasked is None else self.nRowsMasked, dtype=dtype)
+        for i, key in enumerate(lst_keys):
+            bits |= np.left_shift(self.RowMask(key).astype(dtype), dtype.type(i))
+        return bits
+
+    def SplitRows(self, df=None):
+        """
+        Return (df rows passing all masked checks, df violating rows)
+        JDL 10/18/26
+        """
+        df = self.CheckedDf(df)
+        mask = self.RowMask()
+        if mask.size == 0: return df, df.iloc[0:0]
+        return df[~mask], df[mask]
+
+    def ClearRowMasks(self):
+        """
+        Clear stored row masks (e.g. before checking a different df)
+        JDL 10/18/26
+        """
+        self.dict_row_masks, self.nRowsMasked = {}, None
+
+    def ViolationTable(self):
+        """
+        Return DataFrame of violations recorded while .IsViolations
+        (columns per lst_violation_cols)
+        JDL 10/18/26
+        """
+        if len(self.lst_violations) == 0: return pd.DataFrame(columns=lst_violation_cols)
+        return pd.concat(self.lst_violations, ignore_index=True)
+
+    def WriteViolations(self, path_out):
+        """
+        Write violation table to .parquet or .csv path_out (True if written)
+        JDL 10/18/26
+        """
+        return write_violations(self.ViolationTable(), path_out)
+
+    @cached_check(lambda self, df, a: [df[a['col_name']]])
     def ColPopulated(self, col_name, df=None):
         """
         All values in a specified column are non-null (True if so)
         JDL 2/16/24; Modified 8/27/24 to add df arg
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
         #Report blank values in specified column
-        if not df[col_name].isna().any(): return True
-        if self.errs.is_fail(True, 4, self.errs.Locn, col_name): self.errs.RecordErr()
-        return False
+        ser = df[col_name]
+        if is_col_populated(ser): return True
+        return self.RecordCheckErr(4, 'ColPopulated', col_name, col_name, ser, \
+                                   lambda: ser.isna().to_numpy())
 
+    @cached_check(lambda self, df, a: [df.columns])
     def ColumnsContainListVals(self, list_vals, df=None):
         """
         DataFrame columns contain a specified list of values
-        JDL 2/16/24; Modified 8/27/24 to add df arg
+        JDL 2/16/24; Modified 8/27/24 to add df arg; 10/18/26 hashed
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
-        # Loop over list_vals and check if in DataFrame columns
-        for val in list_vals:
-            if val not in df.columns:
-                ErrParam = '\nMissing: ' + str(val)
-                if self.errs.is_fail(True, 5, self.errs.Locn, ErrParam): self.errs.RecordErr()
-                return False
-        return True
+        # Hashed membership check of all list_vals; report all missing
+        lst_missing = lst_missing_vals(list_vals, df.columns)
+        if len(lst_missing) == 0: return True
+        ErrParam = '\nMissing: ' + ', '.join(str(val) for val in lst_missing)
+        return self.RecordCheckErr(5, 'ColumnsContainListVals', ErrParam, vals=lst_missing)
     
+    @cached_check(lambda self, df, a: [df.index])
     def IndexContainsListVals(self, list_vals, df=None):
         """
         DataFrame index contains a specified list of values
-        JDL 1/11/24; Modified 8/27/24 to add df arg
+        JDL 1/11/24; Modified 8/27/24 to add df arg; 10/18/26 hashed
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
-        # Loop over list_vals and check if in DataFrame index
-        for val in list_vals:
-            if val not in df.index:
-                ErrParam = '\nMissing: ' + str(val)
-                if self.errs.is_fail(True, 6, self.errs.Locn, ErrParam): self.errs.RecordErr()
-                return False
-        return True
+        # Hashed membership check of all list_vals; report all missing
+        lst_missing = lst_missing_vals(list_vals, df.index)
+        if len(lst_missing) == 0: return True
+        ErrParam = '\nMissing: ' + ', '.join(str(val) for val in lst_missing)
+        return self.RecordCheckErr(6, 'IndexContainsListVals', ErrParam, vals=lst_missing)
 
     def LstColsAllNonBlank(self, df=None, lst_cols=None):
         """
         .tbl.df list of tbl.nonblank_cols all contain at least one non-blank value (True if so)
-        JDL 2/16/24; Modified 8/27/24 to add df arg
+        JDL 2/16/24; Modified 8/27/24 to add df arg; 10/18/26 parallel
         """
         #list to check is tbl attribute unless overridden by args
         if lst_cols is None: lst_cols = self.tbl.nonblank_cols
 
-        for col in lst_cols: 
-            if not self.ColNonBlank(col, df=df,): return False
-        return True
+        #If parallel, find failing columns first and record their errors
+        if self.IsParallel(lst_cols):
+            lst_cols = self.FailingCols(is_col_nonblank, self.CheckedDf(df), lst_cols)
+        return self.CheckEachCol(self.ColNonBlank, lst_cols, df=df)
 
+    def LstColsAllNonBlankBlock(self, df=None, lst_cols=None):
+        """
+        List of columns all contain at least one non-blank value (True if so).
+        Checks df[lst_cols] in one pass and reports every failing column
+        JDL 10/18/26
+        """
+        if lst_cols is None: lst_cols = self.tbl.nonblank_cols
+        df = self.CheckedDf(df)
+
+        self.lst_cols_failed = lst_cols_all_null(df[lst_cols])
+        return self.ReportFailedCols(self.lst_cols_failed, 7, 'ColNonBlank')
+
+    @cached_check(lambda self, df, a: [df[a['col_name']]])
     def ColNonBlank(self, col_name, df=None):
         """
         Specified column contains no non-blank values (True if so)
         JDL 2/16/24; Modified 8/27/24 to add df arg
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
         #Check column contains at least one non-blank value
-        is_col_nonblank = df[col_name].notnull().any()
-        if self.errs.is_fail((not is_col_nonblank), 7, self.errs.Locn, col_name):
-            self.errs.RecordErr()
-            return False
-        return True
+        if is_col_nonblank(df[col_name]): return True
+        return self.RecordCheckErr(7, 'ColNonBlank', col_name, col_name)
 
-    def LstColsAllNumeric(self, df=None, lst_cols=None):
+    def LstColsAllNumeric(self, df=None, lst_cols=None, nViolations=0):
         """
-        .tbl list of .numeric_cols all numeric values (True if so)
-        JDL 2/16/24; Modified 8/27/24 to add df arg
+        .tbl list of .numeric_cols all numeric values (True if so). If
+        nViolations > 0, failures also report non-numeric values (ColNumeric)
+        JDL 2/16/24; Modified 8/27/24 to add df arg; 10/18/26 parallel
         """
         #list to check is tbl attribute unless overridden by args
         if lst_cols is None: lst_cols = self.tbl.numeric_cols
 
-        for col in lst_cols:
-            if not self.ColNumeric(col, df=df): return False
-        return True
+        #If parallel, find failing columns first and record their errors
+        if self.IsParallel(lst_cols):
+            lst_cols = self.FailingCols(is_col_numeric, self.CheckedDf(df), lst_cols)
+        return self.CheckEachCol(self.ColNumeric, lst_cols, df=df, nViolations=nViolations)
 
-    def ColNumeric(self, col_name, df=None):
+    def LstColsAllNumericBlock(self, df=None, lst_cols=None, nViolations=0):
+        """
+        List of columns all non-blank numeric values (True if so). Checks
+        df[lst_cols] in one pass and reports every failing column (with
+        first non-numeric values and number of blanks if nViolations > 0)
+        JDL 10/18/26
+        """
+        if lst_cols is None: lst_cols = self.tbl.numeric_cols
+        df = self.CheckedDf(df)
+
+        self.lst_cols_failed = lst_cols_non_numeric(df[lst_cols])
+        if nViolations > 0:
+            lst_params = []
+            for col in self.lst_cols_failed:
+                vals_bad, nBlank = non_numeric_vals(df[col], nViolations)
+                lst_params.append(str(col) + ' (non-numeric ' + ', '.join(map(str, vals_bad)) + \
+                                  '; blanks ' + str(nBlank) + ')')
+            return self.ReportFailedCols(lst_params, 8, 'ColNumeric', '; ', \
+                                         self.lst_cols_failed)
+        return self.ReportFailedCols(self.lst_cols_failed, 8, 'ColNumeric')
+
+    @cached_check(lambda self, df, a: [df[a['col_name']]])
+    def ColNumeric(self, col_name, df=None, nViolations=0):
         """
-        Values in a specified column are non-blank and numeric (True if so)
-        JDL 2/19/24; Modified 8/27/24 to add df arg
+        Values in a specified column are non-blank and numeric (True if so).
+        If nViolations > 0, a failure also reports the first nViolations
+        distinct non-numeric values and the number of blanks
+        JDL 2/19/24; Modified 8/27/24 to add df arg; 10/18/26 nViolations
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
-        # Convert the column to numeric, coercing non-numeric values to NaN
-        col_numeric = pd.to_numeric(df[col_name], errors='coerce')
-        is_col_all_numeric = not col_numeric.isna().any()
-        if self.errs.is_fail((not is_col_all_numeric), 8, self.errs.Locn, str(col_name)):
-            self.errs.RecordErr()
-            return False
-        return True
-
-    def LstColsAllInNumericRange(self, lst_cols, llim=None, ulim=None, df=None):
+        # Check column converts to numeric with no blank or non-numeric values
+        ser = df[col_name]
+        if is_col_numeric(ser): return True
+        ErrParam = str(col_name)
+        if nViolations > 0:
+            vals_bad, nBlank = non_numeric_vals(ser, nViolations)
+            ErrParam += '\nNon-numeric values: ' + ', '.join(map(str, vals_bad)) + \
+                        '\nBlank values: ' + str(nBlank)
+        return self.RecordCheckErr(8, 'ColNumeric', ErrParam, col_name, ser, \
+                                   lambda: mask_non_numeric(ser))
+
+    def LstColsAllInNumericRange(self, lst_cols, llim=None, ulim=None, df=None, \
+                                 nViolations=0):
         """
         tbls.tbl1.df list of columns' values are within a specified numeric range
-        JDL 2/19/24; Modified 8/27/24 to add df arg
+        JDL 2/19/24; Modified 8/27/24 to add df arg; 10/18/26 parallel
         """
-        for col in lst_cols:
-            if not self.ColValsInNumericRange(col, llim=llim, ulim=ulim, df=df): return False
-        return True
-
-    def ColValsInNumericRange(self, col, llim=None, ulim=None, df=None):
+        #If parallel, find failing columns first and record their errors
+        if self.IsParallel(lst_cols):
+            lst_cols = self.FailingCols(is_col_in_numeric_range, self.CheckedDf(df), \
+                                        lst_cols, llim, ulim)
+        return self.CheckEachCol(self.ColValsInNumericRange, lst_cols, llim=llim, \
+                                 ulim=ulim, df=df, nViolations=nViolations)
+
+    def LstColsAllInNumericRangeBlock(self, lst_cols, llim=None, ulim=None, df=None, \
+                                      nViolations=0):
+        """
+        List of columns' values all within numeric range (True if so). Reduces
+        df[lst_cols] min/max as one block and reports every failing column
+        (with observed min/max and first violating rows if nViolations > 0)
+        JDL 10/18/26
         """
-        Column values (must be numeric) are within specified range
-        JDL 2/19/24; Modified 8/27/24 to add df arg
+        df = self.CheckedDf(df)
+
+        self.lst_cols_failed = lst_cols_out_of_range(df[lst_cols], llim, ulim)
+        lst_params = self.lst_cols_failed
+        if nViolations > 0:
+            lst_params = []
+            for col in self.lst_cols_failed:
+                vmin, vmax, labels = range_violations(df[col], llim, ulim, nViolations)
+                lst_params.append(str(col) + ' (min ' + str(vmin) + ', max ' + str(vmax) + \
+                                  '; rows ' + ', '.join(map(str, labels)) + ')')
+            return self.ReportFailedCols(lst_params, 9, 'ColValsInNumericRange', '; ', \
+                                         self.lst_cols_failed)
+        return self.ReportFailedCols(lst_params, 9, 'ColValsInNumericRange')
+
+    @cached_check(lambda self, df, a: [df[a['col']]])
+    def ColValsInNumericRange(self, col, llim=None, ulim=None, df=None, nViolations=0):
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        Column values (must be numeric) are within specified range. If
+        nViolations > 0, a failure also reports the observed min/max and the
+        first nViolations violating index labels
+        JDL 2/19/24; Modified 8/27/24 to add df arg; 10/18/26 nViolations
+        """
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
-        is_in_range = True
-
-        # If llim specified check column values greater than or equal to llim
-        if llim is not None:
-            if not df[col].ge(llim).all(): is_in_range = False
-
-        # If ulim specified check column values less than or equal to ulim
-        if ulim is not None:
-            if not df[col].le(ulim).all(): is_in_range = False
-
-        if self.errs.is_fail((not is_in_range), 9, self.errs.Locn, str(col)):
-            self.errs.RecordErr()
-            return False
-        return True
-
+        ser = df[col]
+        if is_col_in_numeric_range(ser, llim, ulim): return True
+        ErrParam = str(col)
+        if nViolations > 0:
+            vmin, vmax, labels = range_violations(ser, llim, ulim, nViolations)
+            ErrParam += '\nObserved min: ' + str(vmin) + ', max: ' + str(vmax) + \
+                        '\nFirst violating rows: ' + ', '.join(map(str, labels))
+        return self.RecordCheckErr(9, 'ColValsInNumericRange', ErrParam, col, ser, \
+                                   lambda: mask_out_of_range(ser, llim, ulim))
+
+    def LstColsMatchRegex(self, lst_cols, str_regex, IgnoreCase=False, df=None):
+        """
+        List of columns' values all match specified regex pattern
+        JDL 10/18/26
+        """
+        #If parallel, find failing columns first and record their errors
+        if self.IsParallel(lst_cols):
+            lst_cols = self.FailingCols(is_col_matching_regex, self.CheckedDf(df), \
+                                        lst_cols, str_regex, IgnoreCase)
+        return self.CheckEachCol(self.ColValsMatchRegex, lst_cols, str_regex=str_regex, \
+                                 IgnoreCase=IgnoreCase, df=df)
+
+    @cached_check(lambda self, df, a: [df[a['col_name']]])
     def ColValsMatchRegex(self, col_name, str_regex, IgnoreCase=False, df=None):
         """
         Column values match specified regex pattern
         JDL 3/1/24; Modified 8/27/24 to add df arg
+        Modified 10/18/26 for vectorized match and reporting first non-match
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
         # Check if all column values match the regex
-        fn_lambda = lambda x: bool(re.match(str_regex, str(x)))
-        if IgnoreCase: fn_lambda = lambda x: bool(re.match(str_regex, str(x), re.IGNORECASE))
-        is_match =  df[col_name].apply(fn_lambda).all()
+        i_row = first_regex_mismatch(df[col_name], str_regex, IgnoreCase)
+        if i_row is None: return True
 
-        if self.errs.is_fail((not is_match), 10, self.errs.Locn, str(col_name)):
-            self.errs.RecordErr()
-            return False
-        return True
+        # Report the first non-matching value and its index label
+        ser = df[col_name]
+        ErrParam = str(col_name) + '\nNon-match: ' + str(ser.iloc[i_row]) + \
+                    ' (row ' + str(df.index[i_row]) + ')'
+        return self.RecordCheckErr(10, 'ColValsMatchRegex', ErrParam, col_name, ser, \
+                                   lambda: mask_regex_mismatch(ser, str_regex, IgnoreCase))
 
+    @cached_check(lambda self, df, a: [df[a['col_name']]])
     def ColContainsListVals(self, col_name, list_vals, df=None):
         """
         Individual column contains a specified list of values
-        JDL 6/24/24; Modified 8/27/24 to add df arg
+        JDL 6/24/24; Modified 8/27/24 to add df arg; 10/18/26 hashed
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
-        # Loop over list_vals and check if in DataFrame index
-        for val in list_vals:
-            if val not in self.tbl.df[col_name].values:
-                ErrParam = '\nMissing: ' + str(val)
-                if self.errs.is_fail(True, 11, self.errs.Locn, ErrParam): self.errs.RecordErr()
-                return False
-        return True
+        # Hashed lookup of list_vals in (cached) column value index
+        lst_missing = lst_missing_vals(list_vals, self.ColValsIndex(df, col_name))
+        if len(lst_missing) == 0: return True
+        ErrParam = '\nMissing: ' + ', '.join(str(val) for val in lst_missing)
+        return self.RecordCheckErr(11, 'ColContainsListVals', ErrParam, col_name, \
+                                   vals=lst_missing)
 
+    @cached_check(lambda self, df, a: [df[a['col_name']]])
     def ColContainsNodupsListVals(self, col_name, list_vals, df=None):
         """
         Column does not have duplicates of a list of values
-        JDL 6/24/24; Modified 8/27/24 to add df arg
+        JDL 6/24/24; Modified 8/27/24 to add df arg; 10/18/26 single pass
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
-        # Loop over list_vals and check if in DataFrame index
-        for val in list_vals:
-            fil = df[col_name] == val
-            if df.loc[fil, col_name].index.size > 1:
-                ErrParam = '\nDuplicate: ' + str(val)
-                if self.errs.is_fail(True, 12, self.errs.Locn, ErrParam): self.errs.RecordErr()
-                return False
-        return True
+        # Count list_vals rows in one pass; report all duplicates with counts
+        ser = df[col_name]
+        dup_counts = ser_dup_counts(ser, list_vals)
+        if dup_counts.size == 0: return True
+        ErrParam = '\nDuplicate: ' + ', '.join(str(val) + ' (' + str(n) + ' rows)' \
+                    for val, n in dup_counts.items())
+        return self.RecordCheckErr(12, 'ColContainsNodupsListVals', ErrParam, col_name, \
+                                   ser, lambda: ser.isin(dup_counts.index).to_numpy())
 
+    @cached_check(lambda self, df, a: [df[a['col_name1']], df[a['col_name2']]])
     def TableLocMatchesRegex(self, col_name1, val, col_name2, str_regex, \
                              IgnoreCase=False, df=None):
         """
         Specific table value matches regex pattern
         JDL 6/24/24; Modified 8/27/24 to add df arg
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
         # Filter DataFrame based on col_name1 and val to lookup col_name2 value
         fil = df[col_name1] == val
         val_loc = df.loc[fil, col_name2].values[0]
 
-        # Compile regex with IGNORECASE flag if IgnoreCase is True
-        if IgnoreCase:
-            pattern = re.compile(str_regex, re.IGNORECASE)
-        else:
-            pattern = re.compile(str_regex)
+        # Compile regex with IGNORECASE flag if IgnoreCase is True (cached)
+        pattern = compiled_regex(str_regex, IgnoreCase)
 
         # Check if val_loc matches the regex pattern
         is_match = bool(pattern.match(val_loc))
 
-        if self.errs.is_fail((not is_match), 13, self.errs.Locn):
-            self.errs.ErrParam = '\nNon-match: ' + str(val_loc)
-            self.errs.RecordErr()
-            return False
-        return True
+        if is_match: return True
+        return self.RecordCheckErr(13, 'TableLocMatchesRegex', '\nNon-match: ' + str(val_loc), \
+                                   col_name2, vals=[val_loc])
 
+    @cached_check(lambda self, df, a: [df[list(a['col'])] if isinstance(a['col'], (list, tuple)) \
+                                       else df[a['col']]])
     def NoDuplicateColVals(self, col, df=None):
         """
-        Specified column does not have duplicate values (True if so)
-        JDL 1/26/24
+        Specified column (or list of columns as a composite key) does not
+        have duplicate values (True if so)
+        JDL 1/26/24; Modified 10/18/26 for composite keys and fast paths
         """
-        #Enable custom error codes and set df with precedence to arg df if supplied
-        if not self.IsCustomCodes: self.errs.Locn = util.current_fn()
+        #Set df with precedence to arg df if supplied
         if df is None: df = self.tbl.df
 
-        if df[col].is_unique: return True
-        if self.errs.is_fail(True, 14, self.errs.Locn, col): self.errs.RecordErr()
-        return False
+        #Composite key --hash rows of key columns in one pass
+        if isinstance(col, (list, tuple)):
+            df_keys = df[list(col)]
+            if is_unique_rows(df_keys): return True
+            col = ', '.join(map(str, col))
+            ser = None
+            if self.IsViolations:
+                ser = pd.Series(list(df_keys.itertuples(index=False, name=None)), \
+                                index=df.index, dtype=object)
+            return self.RecordCheckErr(14, 'NoDuplicateColVals', col, col, ser, \
+                                       lambda: df_keys.duplicated(keep=False).to_numpy())
+
+        #Reuse cached values index if enabled (shared with membership checks)
+        ser = df[col]
+        if self.IsCacheIndex:
+            if len(self.ColValsIndex(df, col)) == len(ser): return True
+        elif is_unique_vals(ser): return True
+        return self.RecordCheckErr(14, 'NoDuplicateColVals', col, col, ser, \
+                                   lambda: ser.duplicated(keep=False).to_numpy())
+"""
+=========================================================================
+Streaming checks for frames larger than memory. CheckDataFrameChunks
+runs a list of checks (added with .AddCheck) over an iterator of DataFrame
+chunks --e.g. pd.read_csv(chunksize=...) or pyarrow record batches. Each
+check is a ChunkCheck that carries its state across chunks: hashed keys
+seen (uniqueness), values not yet found (membership) and pass/fail flags
+(populated, nonblank, numeric, range), so memory is bounded by one chunk
+plus that state. Failures are reported after the last chunk with the
+error codes of the equivalent CheckDataFrame method
+=========================================================================
+"""
+class ChunkCheck(abc.ABC):
+    IsFailFinal = True # Failure is final once flagged (before last chunk)
+
+    def __init__(self, check, col=None):
+        """
+        State of one check carried across DataFrame chunks (base class)
+        JDL 10/18/26
+        """
+        self.check = check # CheckDataFrame method name (error code lookup)
+        self.col = col
+        self.IsFail = False
+
+    @abc.abstractmethod
+    def Update(self, chunk):
+        """
+        Update state with a chunk (implemented by each subclass)
+        JDL 10/18/26
+        """
+
+    def ErrParam(self):
+        """
+        Return error parameter string reported if the check failed
+        JDL 10/18/26
+        """
+        return str(self.col)
+
+class ChunkPopulated(ChunkCheck):
+    def Update(self, chunk):
+        """
+        Fail if chunk column contains null values
+        JDL 10/18/26
+        """
+        if not self.IsFail: self.IsFail = not is_col_populated(chunk[self.col])
+
+class ChunkNonBlank(ChunkCheck):
+    IsFailFinal = False # Fails unless a later chunk has a non-blank value
+
+    def __init__(self, check, col=None):
+        """
+        Column must contain a non-blank value in at least one chunk
+        JDL 10/18/26
+        """
+        super().__init__(check, col)
+        self.IsFail = True
+
+    def Update(self, chunk):
+        """
+        Pass once any chunk has a non-blank column value
+        JDL 10/18/26
+        """
+        if self.IsFail: self.IsFail = not is_col_nonblank(chunk[self.col])
+
+class ChunkNumeric(ChunkCheck):
+    def Update(self, chunk):
+        """
+        Fail if chunk column has blank or non-numeric values
+        JDL 10/18/26
+        """
+        if not self.IsFail: self.IsFail = not is_col_numeric(chunk[self.col])
+
+class ChunkInRange(ChunkCheck):
+    def __init__(self, check, col=None, llim=None, ulim=None):
+        """
+        Column values within numeric range in every chunk
+        JDL 10/18/26
+        """
+        super().__init__(check, col)
+        self.llim, self.ulim = llim, ulim
+
+    def Update(self, chunk):
+        """
+        Fail if chunk column has values outside range (min/max reduction)
+        JDL 10/18/26
+        """
+        if not self.IsFail:
+            self.IsFail = not is_col_in_numeric_range(chunk[self.col], self.llim, self.ulim)
+
+class ChunkContainsVals(ChunkCheck):
+    def __init__(self, check, col=None, list_vals=None):
+        """
+        Column contains all list_vals across chunks (state: values not found)
+        JDL 10/18/26
+        """
+        super().__init__(check, col)
+        self.lst_missing = [] if list_vals is None else list(list_vals)
+
+    def Update(self, chunk):
+        """
+        Remove list_vals found in chunk column (hashed lookup)
+        JDL 10/18/26
+        """
+        if len(self.lst_missing) == 0: return
+        self.lst_missing = lst_missing_vals(self.lst_missing, chunk[self.col])
+        self.IsFail = len(self.lst_missing) > 0
+
+    def ErrParam(self):
+        """
+        Return string of list_vals not found in any chunk
+        JDL 10/18/26
+        """
+        return '\nMissing: ' + ', '.join(map(str, self.lst_missing))
+
+def vals_equal(vals1, vals2):
+    """
+    Return bool array True where same-length arrays vals1 and vals2 are
+    equal element by element (nulls equal each other, as in duplicated)
+    JDL 10/18/26
+    """
+    is_eq = np.broadcast_to(np.asarray(vals1 == vals2, dtype=bool), len(vals1))
+    return is_eq | (pd.isna(vals1) & pd.isna(vals2))
+
+def is_in_hash_run(keys_run, vals_run, keys, vals):
+    """
+    Return bool array True for vals present in a run of values sorted by
+    their hashes keys_run. Hash matches are confirmed against the run's
+    values, so a hash collision is not reported as a match
+    JDL 10/18/26
+    """
+    i_pos = np.searchsorted(keys_run, keys)
+    is_in = np.zeros(len(keys), dtype=bool)
+    idx = np.flatnonzero(keys_run[np.minimum(i_pos, len(keys_run) - 1)] == keys)
+    is_in[idx] = vals_equal(vals_run[i_pos[idx]], vals[idx])
+
+    # Rare: hash matched a different value --compare run's other values with same hash
+    for i in idx[~is_in[idx]]:
+        j = i_pos[i] + 1
+        while (j < len(keys_run)) and (keys_run[j] == keys[i]) and not is_in[i]:
+            is_in[i] = vals_equal(vals_run[j:j + 1], vals[i:i + 1])[0]
+            j += 1
+    return is_in
+
+def chunk_hash_keys(vals):
+    """
+    Return uint64 hash keys of ndarray vals. Numeric values hash as float64
+    so chunks read with different dtypes (e.g. int64, then float64 after a
+    blank row) give 3 and 3.0 the same key; equal-key values are compared
+    exactly, so large ints sharing a float64 key are not reported as dups
+    JDL 10/18/26
+    """
+    if vals.dtype.kind in 'iuf': return pd.util.hash_array(vals.astype(np.float64))
+    return pd.util.hash_array(vals)
+
+class ChunkNoDups(ChunkCheck):
+    def __init__(self, check, col=None, nReportVals=10):
+        """
+        Column (index if col is None) values unique across chunks. State is
+        a few runs of distinct values sorted by 64-bit hash; runs of similar
+        size are merged, so each value is re-sorted O(log n) times rather
+        than all values seen being re-sorted per chunk. Hash matches are
+        confirmed against the stored values
+        JDL 10/18/26; Modified 10/18/26 for merged runs and exact matches
+        """
+        super().__init__(check, col)
+        self.lst_runs = [] # (sorted hash keys, values in same order) per run
+        self.nReportVals = nReportVals # Max duplicate values kept for report
+        self.lst_dups = []
+
+    def Update(self, chunk):
+        """
+        Flag values duplicated within chunk or seen in earlier chunks
+        JDL 10/18/26
+        """
+        vals = chunk.index if self.col is None else chunk[self.col]
+        vals = np.asarray(vals)
+
+        # Sort chunk by hash key (sorted searchsorted queries are much faster)
+        keys = chunk_hash_keys(vals)
+        i_sort = np.argsort(keys, kind='stable')
+        keys, vals = keys[i_sort], vals[i_sort]
+
+        # Duplicates within chunk (exact hash table) or in earlier chunks' runs
+        is_dup = pd.Series(vals).duplicated().to_numpy()
+        for keys_run, vals_run in self.lst_runs:
+            is_dup |= is_in_hash_run(keys_run, vals_run, keys, vals)
+        self.AddRun(keys[~is_dup], vals[~is_dup])
+        if not is_dup.any(): return
+
+        self.IsFail = True
+        for val in pd.unique(vals[is_dup]):
+            if len(self.lst_dups) >= self.nReportVals: break
+            if not val in self.lst_dups: self.lst_dups.append(val)
+
+    def AddRun(self, keys, vals):
+        """
+        Add run of new distinct values (sorted by hash keys); merge the last
+        runs while the earlier one is under twice the size of the later one
+        JDL 10/18/26
+        """
+        if len(keys) == 0: return
+        self.lst_runs.append((keys, vals))
+        while len(self.lst_runs) > 1 and \
+              len(self.lst_runs[-2][0]) < 2 * len(self.lst_runs[-1][0]):
+            (keys1, vals1), (keys2, vals2) = self.lst_runs[-2], self.lst_runs[-1]
+            # Keep exact values if runs' dtypes differ (e.g. int64 and float64)
+            if vals1.dtype != vals2.dtype: vals1, vals2 = vals1.astype(object), vals2.astype(object)
+            keys, vals = np.concatenate([keys1, keys2]), np.concatenate([vals1, vals2])
+
+            # Stable sort (timsort) of two sorted runs is a linear merge
+            i_sort = np.argsort(keys, kind='stable')
+            self.lst_runs[-2:] = [(keys[i_sort], vals[i_sort])]
+
+    def ErrParam(self):
+        """
+        Return string of (first nReportVals) duplicated values
+        JDL 10/18/26
+        """
+        str_dups = ', '.join(map(str, self.lst_dups))
+        if self.col is None: return '\nDuplicate indices: ' + str_dups
+        return str(self.col) + '\nDuplicates: ' + str_dups
+
+#Rows per fingerprinted block for CheckDataFrameChunks.CheckIncremental
+nRowsFingerprintBlock = 65536
+
+def row_hashes(vals):
+    """
+    Return uint64 hash per value of vals (Series or Index) weighted by odd
+    row position so block fingerprints (sums) are order-sensitive
+    JDL 10/18/26
+    """
+    hashes = value_hashes(vals)
+    weights = np.arange(1, 2 * len(hashes), 2, dtype=np.uint64)
+    return hashes * weights
+
+def block_fingerprints(hashes, nRows, nRowsBlock=None):
+    """
+    Return array of fingerprints (wrapping uint64 sums of row hashes) for
+    blocks of nRowsBlock rows covering the first nRows hashes
+    JDL 10/18/26
+    """
+    if nRowsBlock is None: nRowsBlock = nRowsFingerprintBlock
+    if nRows == 0: return np.zeros(0, dtype=np.uint64)
+    return np.add.reduceat(hashes[:nRows], np.arange(0, nRows, nRowsBlock))
+
+#CheckDataFrame method name -> (ChunkCheck class, local error code)
+dict_chunk_checks = {'NoDuplicateIndices':(ChunkNoDups, 3), \
+                     'ColPopulated':(ChunkPopulated, 4), \
+                     'ColNonBlank':(ChunkNonBlank, 7), \
+                     'ColNumeric':(ChunkNumeric, 8), \
+                     'ColValsInNumericRange':(ChunkInRange, 9), \
+                     'ColContainsListVals':(ChunkContainsVals, 11), \
+                     'NoDuplicateColVals':(ChunkNoDups, 14)}
+
+class CheckDataFrameChunks(CheckDataFrame):
+    def __init__(self, path_err_codes, tbl=None, IsCustomCodes=False, \
+                 IsPrint=True, IsLog=False, IsCollectAll=None):
+        """
+        CheckDataFrame variant that checks an iterator of DataFrame chunks
+        JDL 10/18/26
+        """
+        super().__init__(path_err_codes, tbl, IsCustomCodes, IsPrint, IsLog, \
+                         IsCollectAll=IsCollectAll)
+        self.lst_check_specs = [] # (check, col, kwargs) added with .AddCheck
+        self.lst_checks = [] # ChunkCheck instances of latest .CheckChunks
+        self.nChunks, self.nRows = 0, 0
+
+        #.CheckIncremental state: (nRows, block fingerprints) by checked column
+        #(None for index) and each check's latest mode ('full', 'delta', 'skip')
+        self.dict_fingerprints = {}
+        self.lst_check_modes = []
+
+    def AddCheck(self, check, col=None, **kwargs):
+        """
+        Add check by CheckDataFrame method name (keys of dict_chunk_checks);
+        kwargs are check parameters (llim, ulim, list_vals or nReportVals)
+        JDL 10/18/26
+        """
+        if not check in dict_chunk_checks: raise KeyError('Not a chunk check: ' + check)
+        self.lst_check_specs.append((check, col, kwargs))
+
+    def CheckChunks(self, chunks):
+        """
+        Run added checks over chunks in one pass; report every failing
+        check after the last chunk (True if all pass). Checked columns must
+        be in the first chunk (reported as ContainsRequiredCols otherwise).
+        If fail-fast (.IsCollectAll False), no further chunks are read after
+        a chunk with a failure
+        JDL 10/18/26
+        """
+        IsFailFast = self.IsFailFast(False)
+        self.nChunks, self.nRows = 0, 0
+        is_stopped = False
+
+        #Fresh ChunkCheck state for each run (chunks are not fingerprinted)
+        self.lst_checks = [self.NewChunkCheck(spec) for spec in self.lst_check_specs]
+        self.dict_fingerprints = {}
+        for chunk in chunks:
+            if not isinstance(chunk, pd.DataFrame): chunk = chunk.to_pandas()
+            if self.nChunks == 0:
+                cols_req = [ck.col for ck in self.lst_checks if ck.col is not None]
+                if not self.ContainsRequiredCols(list(dict.fromkeys(cols_req)), df=chunk):
+                    return False
+            for ck in self.lst_checks: ck.Update(chunk)
+            self.nChunks, self.nRows = self.nChunks + 1, self.nRows + len(chunk)
+            if IsFailFast and any(ck.IsFail and ck.IsFailFinal for ck in self.lst_checks):
+                is_stopped = True
+                break
+
+        return self.ReportChunkChecks(is_stopped)
+
+    def NewChunkCheck(self, spec):
+        """
+        Return new ChunkCheck instance for spec (check, col, kwargs)
+        JDL 10/18/26
+        """
+        check, col, kwargs = spec
+        return dict_chunk_checks[check][0](check, col, **kwargs)
+
+    def CheckIncremental(self, df=None):
+        """
+        Revalidate df incrementally against the previous call's state. Each
+        checked column's (or index's) block fingerprints are compared with
+        the previous call's: unchanged columns are skipped, appended rows
+        are checked alone with the carried check state (uniqueness keys,
+        values not yet found), and edited columns are rechecked in full.
+        Reports failing checks as .CheckChunks (True if all pass)
+        JDL 10/18/26
+        """
+        df = self.CheckedDf(df)
+        cols_req = [col for check, col, kwargs in self.lst_check_specs if col is not None]
+        if not self.ContainsRequiredCols(list(dict.fromkeys(cols_req)), df=df): return False
+
+        #Row hashes and previous fingerprints by checked column
+        dict_hashes, dict_prev = {}, self.dict_fingerprints
+        for check, col, kwargs in self.lst_check_specs:
+            if col in dict_hashes: continue
+            dict_hashes[col] = row_hashes(df.index if col is None else df[col])
+        self.dict_fingerprints = {col:(len(df), block_fingerprints(hashes, len(df))) \
+                                  for col, hashes in dict_hashes.items()}
+
+        #Check appended rows only if previous rows unchanged; else full df
+        if len(self.lst_checks) != len(self.lst_check_specs): self.lst_checks = []
+        lst_checks, self.lst_check_modes = [], []
+        for i, spec in enumerate(self.lst_check_specs):
+            col = spec[1]
+            nRowsPrev, fp_prev = dict_prev.get(col, (None, None))
+            IsPrefix = (len(self.lst_checks) > 0) and (nRowsPrev is not None) and \
+                        (nRowsPrev <= len(df)) and np.array_equal(fp_prev, \
+                        block_fingerprints(dict_hashes[col], nRowsPrev))
+            if IsPrefix and (nRowsPrev == len(df)):
+                ck, mode = self.lst_checks[i], 'skip'
+            elif IsPrefix:
+                ck, mode = self.lst_checks[i], 'delta'
+                ck.Update(df.iloc[nRowsPrev:])
+            else:
+                ck, mode = self.NewChunkCheck(spec), 'full'
+                ck.Update(df)
+            lst_checks.append(ck)
+            self.lst_check_modes.append(mode)
+        self.lst_checks, self.nRows = lst_checks, len(df)
+        return self.ReportChunkChecks()
+
+    def ReportChunkChecks(self, is_stopped=False):
+        """
+        Record one error per failed .lst_checks check (True if none failed).
+        If stopped early, only checks whose failure is final are reported
+        JDL 10/18/26
+        """
+        lst_failed = [ck for ck in self.lst_checks \
+                      if ck.IsFail and (ck.IsFailFinal or not is_stopped)]
+        if self.IsFailFast(False): lst_failed = lst_failed[:1]
+
+        #Record one error per failing check (reset errs between reports)
+        for i, ck in enumerate(lst_failed):
+            if i > 0: self.errs.ResetWarning()
+            self.ReportFailedCols([ck.ErrParam()], dict_chunk_checks[ck.check][1], ck.check, \
+                                  lst_cols=[ck.col])
+        self.lst_cols_failed = list(dict.fromkeys(ck.col for ck in lst_failed \
+                                                  if ck.col is not None))
+        return len(lst_failed) == 0
 """
 =========================================================================
 This class checks a specified list of Excel files (path+filename) for
@@ -388,7 +1986,7 @@ class CheckExcelFiles:
         JDL 1/4/24
         """
         # Set location for looking up error messages
-        self.errs.Locn = util.current_fn()
+        self.errs.Locn = 'CheckFilesProcedure'
 
         for idx in range(len(self.lst_files)):
 
@@ -423,8 +2021,9 @@ class CheckExcelFiles:
     def ExcelFileOpens(self, idx):
         """
         Check if file is a valid Excel file based on ability to open
-        JDL 1/4/24
+        JDL 1/4/24; Modified 10/18/26 to import openpyxl only when needed
         """
+        from openpyxl import load_workbook
         fpath = self.lst_files[idx]
         try:
             self.wb = load_workbook(filename=fpath)
@@ -1,16 +1,17 @@
 import os, sys
 import pandas as pd
+import concurrent.futures
 import logging
 logging.basicConfig(level=logging.ERROR, filename='demo.log', format='%(message)s')
 
 path_libs = os.getcwd() + os.sep + 'libs' + os.sep
 if not path_libs in sys.path: sys.path.append(path_libs)
 import pd_util
+from error_handling import ErrorHandle
+from preflight import CheckDataFrame
 
 #Add the libs subdirectory to sys.path and import the libraries
 #from projfiles import Files
-#from error_handling import ErrorHandle
-#from preflight import CheckDataFrame
 
 class ProjectTables():
     """
@@ -78,7 +79,7 @@ class Table():
     """
     Attributes for a data table including import instructions. Table instances
     are attributes of ProjectTables Class to allow iteration over tables
-    JDL Modified 8/27/24 add _cols list attribute initialization
+    JDL Modified 8/27/24 add _cols list attribute initialization; 10/18/26 schema
     """
     def __init__(self, sPF, name, sht, ColNameIdx, name_lastcol=None):
                 
@@ -101,6 +102,9 @@ class Table():
         self.populated_cols = []
         self.nonblank_cols = []
 
+        #Optional preflight.TableSchema of column checks (see CheckSchema)
+        self.schema = None
+
     def ResetDefaultIndex(self, IsDrop=True):
         """
         Set or Reset df index to the default defined for the table
@@ -115,10 +119,71 @@ class Table():
 class CheckInputs:
     """
     Check the tbls dataframes for errors
+    JDL Modified 10/18/26 to add CheckTablesProcedure with nWorkers option
+    and IsCollectAll option (see preflight.CheckDataFrame)
     """
-    def __init__(self, tbls, IsPrint=True):
+    def __init__(self, tbls, IsPrint=True, path_err_codes=None, nWorkers=1, \
+                 IsCollectAll=None, IsLog=False):
         self.tbls = tbls
         self.IsPrint = IsPrint
+        self.IsLog = IsLog
 
         #preflight.CheckDataFrame Class --instanced as needed in methods below
         self.ckdf = None    
+
+        #Error codes location (default ErrorCodes.xlsx in this module's
+        #libs directory) and number of tables to check concurrently
+        if path_err_codes is None:
+            path_err_codes = os.path.dirname(os.path.abspath(__file__)) + os.sep
+        self.path_err_codes = path_err_codes
+        self.nWorkers = nWorkers
+
+        #True to report all failing checks/columns per table; None/False fail fast
+        self.IsCollectAll = IsCollectAll
+
+        #ErrorHandle with merged results of table checks (set by procedure)
+        self.errs = None
+
+    def CheckTablesProcedure(self, lst_tbls=None):
+        """
+        Check each table's df (in parallel if .nWorkers > 1) and merge the
+        errors into .errs in table order (True if all tables pass)
+        JDL 10/18/26
+        """
+        if lst_tbls is None: lst_tbls = self.tbls.lstImports
+
+        #Check tables --each with its own non-printing CheckDataFrame
+        if (self.nWorkers > 1) and (len(lst_tbls) > 1):
+            with concurrent.futures.ThreadPoolExecutor(self.nWorkers) as executor:
+                lst_results = list(executor.map(self.CheckTable, lst_tbls))
+        else:
+            lst_results = [self.CheckTable(tbl) for tbl in lst_tbls]
+
+        #Merge each table's errors in table order and print them
+        self.errs = ErrorHandle(self.path_err_codes, IsPrint=self.IsPrint, \
+                                IsLog=self.IsLog)
+        for is_pass, errs in lst_results: self.errs.MergeRecords(errs)
+        if self.IsPrint and (len(self.errs.Msgs_Accum) > 0):
+            self.errs.WriteReport(self.errs.Msgs_Accum)
+        return all(is_pass for is_pass, errs in lst_results)
+
+    def CheckTable(self, tbl):
+        """
+        Check a table's df against its required, numeric, populated and
+        nonblank column lists; return (True if passes, its ErrorHandle)
+        JDL 10/18/26
+        """
+        ckdf = CheckDataFrame(self.path_err_codes, tbl, IsPrint=False, \
+                              IsCollectAll=self.IsCollectAll)
+
+        #Column value checks need required columns; then run each check
+        #(stop at first failure unless collect-all)
+        if not ckdf.ContainsRequiredCols(): return False, ckdf.errs
+        is_pass = True
+        for fn_check in [ckdf.LstColsAllNumeric, ckdf.LstColsPopulated, \
+                         ckdf.LstColsAllNonBlank]:
+            if not is_pass:
+                if ckdf.IsFailFast(): break
+                ckdf.errs.ResetWarning()
+            is_pass = fn_check() and is_pass
+        return is_pass, ckdf.errs
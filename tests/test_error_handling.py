@@ -7,12 +7,19 @@ import pandas as pd
 from io import StringIO
 import pytest
 import inspect
+import shutil
+import threading
+import asyncio
+import pickle
+import copy
 
 # Import the class to be tested and mockup driver class
 current_dir = os.path.dirname(os.path.abspath(__file__))
 libs_dir = os.path.dirname(current_dir) +  os.sep + 'libs' + os.sep
 if not libs_dir in sys.path: sys.path.append(libs_dir)
 from error_handling import ErrorHandle
+import error_handling
+import logging
 
 """
 =========================================================================
@@ -79,6 +86,247 @@ def test_ReportError(errs, df_errs_test, capfd):
     # Check that .ErrMsg is appended to .ErrMsgsAccum
     assert errs.Msgs_Accum == 'A check1 error occurred'
 
+def test_AddErrRecord(errs, df_errs_test):
+    """
+    Append ErrRecord for current error (or only count it if at .MaxMsgs)
+    JDL 10/18/26
+    """
+    errs.df_errs = df_errs_test
+    errs.IsWarning, errs.IsPrint = True, False
+
+    # Record three warnings with MaxMsgs cap of two
+    errs.MaxMsgs = 2
+    for param in ['a', 'b', 'c']:
+        errs.is_fail(True, 1, 'check3', param)
+        errs.RecordErr()
+
+    # Two records stored with structured attributes; third only counted
+    assert len(errs.lst_err_records) == 2
+    rec = errs.lst_err_records[1]
+    assert (rec.iCodeReport, rec.Locn, rec.ErrParam) == (111, 'check3', 'b')
+    assert rec.severity == 'WARNING'
+    assert rec.msg == 'Warning: check3: b'
+    assert errs.nMsgsDropped == 1
+    assert errs.dict_dropped_counts == {111: 1}
+
+    # .Msgs_Accum joins stored messages and notes dropped count
+    exp = 'Warning: check3: a\nWarning: check3: b\nAdditional messages not stored: 1'
+    assert errs.Msgs_Accum == exp
+
+    # Assigning empty string resets accumulated records
+    errs.Msgs_Accum = ''
+    assert errs.Msgs_Accum == ''
+    assert len(errs.lst_err_records) == 0 and errs.nMsgsDropped == 0
+
+def test_AggregateErr(errs, df_errs_test, capfd):
+    """
+    Increment count and sample ErrParam for current (Locn, iCodeReport)
+    JDL 10/18/26
+    """
+    errs.df_errs = df_errs_test
+    errs.IsWarning, errs.IsAggregate, errs.nSampleParams = True, True, 2
+
+    # Record the same warning four times and a different one once
+    for param in ['a', 'b', 'c', 'd']:
+        errs.is_fail(True, 1, 'check3', param)
+        errs.RecordErr()
+    errs.is_fail(True, 1, 'check1', 'x')
+    errs.RecordErr()
+
+    # Only first occurrence of each is stored and printed
+    assert capfd.readouterr()[0] == 'Warning: check3: a\nA check1 error occurred: x\n'
+    assert len(errs.lst_err_records) == 2
+
+    # Counts and sampled params by (Locn, iCodeReport)
+    agg = errs.dict_err_aggs[('check3', 111)]
+    assert agg.count == 4
+    assert agg.lst_params == ['a', 'b']
+    assert errs.dict_err_aggs[('check1', 101)].count == 1
+
+def test_ReportSummary(errs, df_errs_test, capfd):
+    """
+    Return (and print if .IsPrint) summary of error counts by Locn/code
+    JDL 10/18/26
+    """
+    errs.df_errs = df_errs_test
+    errs.IsWarning, errs.IsPrint = True, False
+    for param in ['a', 'b', 'c']:
+        errs.is_fail(True, 1, 'check3', param)
+        errs.RecordErr()
+    errs.is_fail(True, 1, 'check1')
+    errs.RecordErr()
+
+    exp = 'Warning: check3 (check3 111): 3; e.g. a, b, c\n' + \
+          'A check1 error occurred (check1 101): 1'
+    assert errs.ReportSummary() == exp
+
+    # Printed if .IsPrint
+    errs.IsPrint = True
+    errs.ReportSummary()
+    assert capfd.readouterr()[0] == exp + '\n'
+
+def test_WriteReport_async(errs, df_errs_test, capfd):
+    """
+    Print and optionally log msg (queued to background writer if async)
+    JDL 10/18/26
+    """
+    errs.df_errs = df_errs_test
+    errs.IsAsyncReport = True
+
+    # Report is written by background writer once queue is flushed
+    errs = InitErrsForTestAppendErrMsg(errs, df_errs_test, 'check1', 1)
+    errs.ReportError()
+    error_handling.flush_async_reports()
+    s = 'The program encountered the following fatal error:\nA check1 error occurred\n'
+    assert capfd.readouterr()[0] == s
+
+    # Stopping the writer writes queued messages first
+    errs.WriteReport('last message')
+    error_handling.stop_async_reports()
+    assert capfd.readouterr()[0] == 'last message\n'
+    assert error_handling.listener_reports is None
+
+def test_reset_log_file_async(errs, tmp_path):
+    """
+    Queued async log messages are written before log file is reset
+    JDL 10/18/26
+    """
+    # Logger with file handler (error_handling logger propagates to it)
+    logger_test = logging.getLogger('error_handling')
+    path_file = str(tmp_path / 'test.log')
+    logger_test.addHandler(logging.FileHandler(path_file))
+
+    errs.IsAsyncReport, errs.IsLog, errs.IsPrint = True, True, True
+    for i in range(100): errs.WriteReport('message ' + str(i))
+
+    # All queued messages written before old file deleted; new file empty
+    errs.reset_log_file(logger_test)
+    assert os.path.isfile(path_file)
+    assert os.path.getsize(path_file) == 0
+
+    errs.WriteReport('after reset')
+    error_handling.stop_async_reports()
+    for handler in list(logger_test.handlers):
+        handler.close()
+        logger_test.removeHandler(handler)
+    with open(path_file) as f: assert f.read() == 'after reset\n'
+
+def test_SetThreadSafe(errs, df_errs_test):
+    """
+    Keep per-error attributes per thread/asyncio task from now on
+    JDL 10/18/26
+    """
+    errs.df_errs = df_errs_test
+    errs.IsWarning, errs.IsPrint = True, False
+    errs.SetThreadSafe()
+
+    # Record warnings concurrently from threads sharing one handler
+    def record_warnings(Locn, i_thread):
+        for i in range(200):
+            errs.is_fail(True, 1, Locn, str(i_thread) + '_' + str(i))
+            errs.RecordErr()
+
+    lst_threads = []
+    for i_thread in range(4):
+        Locn = ['check1', 'check3'][i_thread % 2]
+        lst_threads.append(threading.Thread(target=record_warnings, \
+                                            args=(Locn, i_thread)))
+
+    # Short thread switch interval to make interleaving likely
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    for thread in lst_threads: thread.start()
+    for thread in lst_threads: thread.join()
+    sys.setswitchinterval(interval)
+
+    # Each record's message, code and param are from the same thread's error
+    assert len(errs.lst_err_records) == 800
+    dict_msgs = {'check1': 'A check1 error occurred', 'check3': 'Warning: check3'}
+    for rec in errs.lst_err_records:
+        i_thread = int(rec.ErrParam.split('_')[0])
+        assert rec.Locn == ['check1', 'check3'][i_thread % 2]
+        assert rec.msg == dict_msgs[rec.Locn] + ': ' + rec.ErrParam
+    assert errs.dict_err_aggs[('check3', 111)].count == 400
+
+def test_SetThreadSafe_asyncio(errs):
+    """
+    Per-error attributes are separate for each asyncio task
+    JDL 10/18/26
+    """
+    errs.SetThreadSafe()
+
+    async def set_locn(Locn):
+        errs.Locn = Locn
+        await asyncio.sleep(0)
+        return errs.Locn
+
+    async def run_tasks():
+        return await asyncio.gather(set_locn('a'), set_locn('b'))
+
+    assert asyncio.run(run_tasks()) == ['a', 'b']
+    assert errs.Locn == ''
+
+def test_SetThreadSafe_asyncio_parent(errs, df_errs_test):
+    """
+    Tasks spawned after the parent task's context is initialized don't
+    share its error message lines
+    JDL 10/18/26
+    """
+    errs.df_errs = df_errs_test
+    errs.SetThreadSafe()
+
+    async def append_msg(ErrParam):
+        errs.is_fail(True, 1, errs.Locn, ErrParam)
+        await asyncio.sleep(0)
+        errs.GetBaseErrCode()
+        errs.SetReportErrCode()
+        errs.AppendErrMsg()
+        await asyncio.sleep(0)
+        return errs.ErrMsg
+
+    async def run_tasks():
+        errs.Locn = 'check1'
+        return await asyncio.gather(append_msg('a'), append_msg('b'))
+
+    assert asyncio.run(run_tasks()) == ['A check1 error occurred: a', \
+                                        'A check1 error occurred: b']
+
+def test_ErrorHandle_pickle(errs):
+    """
+    ErrorHandle can be pickled and deep copied (lock and thread/task
+    context rebuilt; current per-error attributes kept)
+    JDL 10/18/26
+    """
+    errs.Locn = 'check1'
+    errs2 = pickle.loads(pickle.dumps(errs))
+    assert errs2.Locn == 'check1'
+    assert errs2.lock_records is not errs.lock_records
+
+    errs.SetThreadSafe()
+    errs.Locn, errs.ErrMsg = 'check3', 'msg'
+    errs3 = copy.deepcopy(errs)
+    assert errs3.IsThreadSafe == True
+    assert (errs3.Locn, errs3.ErrMsg) == ('check3', 'msg')
+    errs3.Locn = 'check2'
+    assert errs.Locn == 'check3'
+
+def test_MergeRecords(errs, df_errs_test):
+    """
+    Merge another ErrorHandle's accumulated records and counts
+    JDL 10/18/26
+    """
+    errs2 = ErrorHandle(libs_dir, IsPrint=False)
+    for e, param in zip([errs, errs2, errs2], ['a', 'b', 'c']):
+        e.df_errs = df_errs_test
+        e.IsWarning, e.IsPrint = True, False
+        e.is_fail(True, 1, 'check3', param)
+        e.RecordErr()
+
+    errs.MergeRecords(errs2)
+    assert [rec.ErrParam for rec in errs.lst_err_records] == ['a', 'b', 'c']
+    assert errs.dict_err_aggs[('check3', 111)].count == 3
+    assert errs.Msgs_Accum.count('Warning: check3') == 3
+
 def test_AppendErrMsg1(errs, df_errs_test):
     """
     Error message for case where iCodeReport is found
@@ -174,6 +422,160 @@ def test_GetBaseErrCode(errs, df_errs_test):
     errs.GetBaseErrCode()
     assert errs.iCodeBase == iErrNotFound, 'Base row not found, but iCodeBase not set to iErrNotFound'
 
+def test_BuildErrCodeIndex(errs, df_errs_test):
+    """
+    Build Locn->Base iCode and iCode->Msg_String lookup dicts from .df_errs
+    JDL 10/18/26
+    """
+    # Assigning .df_errs rebuilds the lookup dicts
+    errs.df_errs = df_errs_test
+    assert errs.dict_base_codes == {'check1': 100, 'check3': 110}
+    assert errs.dict_msgs[101] == 'A check1 error occurred'
+    assert errs.dict_msgs[111] == 'Warning: check3'
+
+    # Locn with no Base row is not in .dict_base_codes
+    assert 'check_no_base' not in errs.dict_base_codes
+
+def test_get_err_codes_catalog(tmp_path):
+    """
+    Return ErrCodeCatalog for path_file --from cache if file is unchanged
+    JDL 10/18/26
+    """
+    # Copy ErrorCodes.xlsx to temporary directory
+    path_file = str(tmp_path / 'ErrorCodes.xlsx')
+    shutil.copy(libs_dir + 'ErrorCodes.xlsx', path_file)
+
+    # Second ErrorHandle reuses the cached catalog
+    errs1 = ErrorHandle(str(tmp_path) + os.sep)
+    errs2 = ErrorHandle(str(tmp_path) + os.sep)
+    assert errs2.df_errs is errs1.df_errs
+    assert errs2.dict_msgs is errs1.dict_msgs
+
+    # IsCacheCodes=False bypasses the cache
+    errs3 = ErrorHandle(str(tmp_path) + os.sep, IsCacheCodes=False)
+    assert errs3.df_errs is not errs1.df_errs
+
+    # Changed file modification time triggers re-import
+    stamp = os.stat(path_file)
+    os.utime(path_file, ns=(stamp.st_atime_ns, stamp.st_mtime_ns + 10**9))
+    errs4 = ErrorHandle(str(tmp_path) + os.sep)
+    assert errs4.df_errs is not errs1.df_errs
+
+def test_clear_err_codes_cache(tmp_path):
+    """
+    Invalidate cached catalog for path_file (or all catalogs if None)
+    JDL 10/18/26
+    """
+    path_file = str(tmp_path / 'ErrorCodes.xlsx')
+    shutil.copy(libs_dir + 'ErrorCodes.xlsx', path_file)
+
+    errs1 = ErrorHandle(str(tmp_path) + os.sep)
+    errs1.LoadCatalog()
+    error_handling.clear_err_codes_cache(path_file)
+    assert os.path.abspath(path_file) not in error_handling.dict_catalog_cache
+
+    # Re-import after invalidation
+    errs2 = ErrorHandle(str(tmp_path) + os.sep)
+    assert errs2.df_errs is not errs1.df_errs
+
+    # Clear all cached catalogs
+    error_handling.clear_err_codes_cache()
+    assert len(error_handling.dict_catalog_cache) == 0
+
+def test_read_err_codes(tmp_path, df_errs_test):
+    """
+    Import error codes df from .xlsx, .csv, .json or compiled .pkl file
+    JDL 10/18/26
+    """
+    # Write test codes in each alternate format and read them back
+    for ext in ['.csv', '.json', '.pkl']:
+        path_file = str(tmp_path / ('ErrorCodes' + ext))
+        assert error_handling.write_err_codes(df_errs_test, path_file)
+        df = error_handling.read_err_codes(path_file)
+        assert df['iCode'].tolist() == df_errs_test['iCode'].tolist()
+        assert df['Msg_String'].tolist() == df_errs_test['Msg_String'].tolist()
+
+    # ErrorHandle with alternate format catalog
+    errs = ErrorHandle(str(tmp_path) + os.sep, f_err_codes='ErrorCodes.csv')
+    assert errs.dict_base_codes['check3'] == 110
+
+    # Unsupported file type
+    with pytest.raises(ValueError):
+        error_handling.read_err_codes(str(tmp_path / 'ErrorCodes.txt'))
+
+def test_read_err_codes_sidecar(tmp_path):
+    """
+    Compiled .pkl sidecar is written with .xlsx read and used when current
+    JDL 10/18/26
+    """
+    path_file = str(tmp_path / 'ErrorCodes.xlsx')
+    path_sidecar = str(tmp_path / 'ErrorCodes.pkl')
+    shutil.copy(libs_dir + 'ErrorCodes.xlsx', path_file)
+
+    # Reading .xlsx writes the sidecar (via temp file, then replace)
+    df1 = error_handling.read_err_codes(path_file, IsSidecar=True)
+    assert os.path.isfile(path_sidecar)
+    assert sorted(os.listdir(tmp_path)) == ['ErrorCodes.pkl', 'ErrorCodes.xlsx']
+    assert error_handling.is_sidecar_current(path_file, path_sidecar)
+
+    # Sidecar is read instead of .xlsx when current (mark it to confirm)
+    df_marked = df1.copy()
+    df_marked.loc[0, 'Msg_String'] = 'from_sidecar'
+    df_marked.to_pickle(path_sidecar)
+    df2 = error_handling.read_err_codes(path_file, IsSidecar=True)
+    assert df2.loc[0, 'Msg_String'] == 'from_sidecar'
+
+    # .xlsx newer than sidecar triggers re-read of .xlsx
+    stamp = os.stat(path_sidecar)
+    os.utime(path_file, ns=(stamp.st_atime_ns, stamp.st_mtime_ns + 10**9))
+    assert not error_handling.is_sidecar_current(path_file, path_sidecar)
+    df3 = error_handling.read_err_codes(path_file, IsSidecar=True)
+    assert df3.loc[0, 'Msg_String'] == df1.loc[0, 'Msg_String']
+
+    # Edited .xlsx copied with an older mtime (e.g. cp -p) is still detected
+    assert error_handling.is_sidecar_current(path_file, path_sidecar)
+    with open(path_file, 'ab') as f: f.write(b'\0')
+    os.utime(path_file, ns=(stamp.st_atime_ns, stamp.st_mtime_ns - 10**9))
+    assert not error_handling.is_sidecar_current(path_file, path_sidecar)
+
+def test_main_compile(tmp_path, capfd):
+    """
+    Compile error codes file to .pkl sidecar or to path specified with -o
+    JDL 10/18/26
+    """
+    path_file = str(tmp_path / 'ErrorCodes.xlsx')
+    shutil.copy(libs_dir + 'ErrorCodes.xlsx', path_file)
+
+    # Default output is .pkl sidecar
+    assert error_handling.main([path_file]) == 0
+    path_sidecar = str(tmp_path / 'ErrorCodes.pkl')
+    assert capfd.readouterr()[0] == path_sidecar + '\n'
+    assert os.path.isfile(path_sidecar)
+
+    # Specified output file
+    path_out = str(tmp_path / 'codes.json')
+    error_handling.main([path_file, '-o', path_out])
+    df = error_handling.read_err_codes(path_out)
+    assert df.index.size == pd.read_pickle(path_sidecar).index.size
+
+def test_LoadCatalog(errs, capfd):
+    """
+    Import error codes file on first lookup (not when ErrorHandle instanced)
+    JDL 10/18/26
+    """
+    # Error codes not imported until needed
+    assert not errs.IsCodesLoaded
+
+    # RecordErr triggers import
+    errs.is_fail(True, 1, 'check1')
+    errs.RecordErr()
+    assert errs.IsCodesLoaded
+    assert 'A Check1 error occurred' in capfd.readouterr()[0]
+
+    # Missing error codes file is still reported when instancing
+    with pytest.raises(FileNotFoundError):
+        ErrorHandle(libs_dir, f_err_codes='xxx.xlsx')
+
 def test_errs_fixture(errs):
     """
     Check instancing of ErrorHandle class for testing
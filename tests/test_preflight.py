@@ -8,6 +8,7 @@ import numpy as np
 from io import StringIO
 import pytest
 import logging
+import pickle
 
 #Allow printing with logging.debug('xxx') commands
 logging.basicConfig(level=logging.DEBUG)
@@ -21,6 +22,10 @@ from preflight import CheckExcelFiles
 from preflight import CheckDataFrame
 from error_handling import ErrorHandle
 from projtables import Table
+from projtables import CheckInputs
+from preflight import ColSpec, TableSchema
+from preflight import CheckDataFrameChunks
+import preflight
 """
 =========================================================================
 Fixtures and global variables for testing
@@ -635,6 +640,74 @@ def test_CheckDataFrame_ColNumeric2(checkdf1, capfd):
     exp = 'custom_ColNumeric: id_index\n'
     check_printout(exp, capfd)
 
+def test_CheckDataFrame_ColNumeric3(checkdf1, capfd):
+    """
+    Dtype dispatch and reporting of specific non-numeric values
+    JDL 10/18/26
+    """
+    # Numeric dtypes need no coercion; floats and nullable ints check nulls
+    assert preflight.is_col_numeric(pd.Series([1, 2], dtype='int64')) == True
+    assert preflight.is_col_numeric(pd.Series([1., np.nan])) == False
+    assert preflight.is_col_numeric(pd.Series([1, None], dtype='Int64')) == False
+    assert preflight.is_col_numeric(pd.Series(['1', 2.5], dtype=object)) == True
+    assert preflight.mask_non_numeric(pd.Series([1, 2])).tolist() == [False, False]
+    df = pd.DataFrame({'i':[1, 2], 'f':[1., np.nan], 'o':['1', 'x']})
+    assert preflight.lst_cols_non_numeric(df) == ['f', 'o']
+
+    # nViolations > 0 reports distinct non-numeric values and blank count
+    checkdf1.tbl.df['id_index'] = checkdf1.tbl.df['id_index'].astype(object)
+    checkdf1.tbl.df.loc[['first_row', 'third_row'], 'id_index'] = 'xyz'
+    checkdf1.tbl.df.loc['fourth_row', 'id_index'] = None
+    assert checkdf1.ColNumeric('id_index', nViolations=3) == False
+    exp = 'ERROR: Column must contain only non-null numeric values: id_index\n' \
+          'Non-numeric values: xyz\nBlank values: 1\n'
+    check_printout(exp, capfd)
+
+def test_CheckDataFrame_ArrowDtypes(checkdf1, capfd):
+    """
+    Checks of Arrow-backed columns use pyarrow.compute kernels
+    JDL 10/18/26
+    """
+    pa = pytest.importorskip('pyarrow')
+    df = pd.DataFrame({'n':pd.Series([1, 5, None], dtype=pd.ArrowDtype(pa.int64())),
+                       's':pd.Series(['ab', 'ac', None], dtype='string[pyarrow]')})
+    assert preflight.arrow_values(pd.Series([1, 2])) is None
+    assert preflight.is_col_populated(df['n'].iloc[:2]) == True
+    assert preflight.is_col_populated(df['n']) == False
+    assert preflight.is_col_nonblank(df['s']) == True
+    assert preflight.is_col_numeric(df['n'].iloc[:2]) == True
+    assert preflight.is_col_in_numeric_range(df['n'].iloc[:2], 1, 5) == True
+    assert preflight.is_col_in_numeric_range(df['n'].iloc[:2], 2, 5) == False
+    assert preflight.is_col_in_numeric_range(df['n'], 1, 5) == False
+    assert preflight.first_regex_mismatch(df['s'].iloc[:2], 'a[bc]') is None
+    assert preflight.first_regex_mismatch(df['s'], 'A', IgnoreCase=True) == 2
+    assert preflight.mask_regex_mismatch(df['s'], 'ab').tolist() == [False, True, True]
+    assert preflight.lst_missing_vals([5, 7], df['n']) == [7]
+    assert preflight.lst_missing_vals(['ac', 3], df['s']) == [3]
+
+    # Regex results match the re path (same values as object dtype) for
+    # nulls, $ before a trailing newline, Unicode classes and case folding
+    ser = pd.Series(['ab', 'ab\n', '\u0663', 'Kb', None], dtype='string[pyarrow]')
+    for str_regex in ['.*', 'ab$', r'\d', '[a-z]', 'k', r'\s*a', '(?i)A']:
+        for IgnoreCase in [False, True]:
+            exp = preflight.mask_regex_mismatch(ser.astype(object), str_regex, IgnoreCase)
+            assert preflight.mask_regex_mismatch(ser, str_regex, IgnoreCase).tolist() == \
+                exp.tolist(), str_regex
+    arr = preflight.arrow_values(ser.iloc[:1])
+    assert preflight.is_arrow_regex_safe(arr, '^[a-z]+$') == True
+    assert preflight.is_arrow_regex_safe(preflight.arrow_values(ser), 'ab$') == False
+    assert preflight.is_arrow_regex_safe(arr, '[[:alpha:]]') == False
+
+    # Block null checks use Arrow null counts
+    assert preflight.lst_cols_with_nulls(df) == ['n', 's']
+    assert preflight.lst_cols_all_null(df.iloc[2:]) == ['n', 's']
+
+    # CheckDataFrame methods on Arrow-backed columns
+    checkdf1.errs.IsPrint = False
+    assert checkdf1.ColValsMatchRegex('s', '^a', df=df.iloc[:2]) == True
+    assert checkdf1.ColContainsListVals('n', [1, 5], df=df) == True
+    assert checkdf1.ColPopulated('s', df=df) == False
+
 def test_CheckDataFrame_LstColsAllInNumericRange1(checkdf2, capfd):
     """
     tbls.tbl1.df list of columns' values are within a specified numeric range
@@ -717,6 +790,52 @@ def test_CheckDataFrame_ColValsInNumericRange2(checkdf1, capfd):
     exp = 'custom_ColValsInNumericRange: id_index\n'
     check_printout(exp, capfd)
 
+def test_CheckDataFrame_ColValsInNumericRange3(checkdf1, capfd):
+    """
+    Column values within range --report observed min/max and first
+    nViolations violating index labels
+    JDL 10/18/26
+    """
+    assert checkdf1.ColValsInNumericRange('id_index', 1002, 1004, nViolations=1) == False
+    exp = 'ERROR: Column values must be within specified numeric range: id_index' + \
+          '\nObserved min: 1001, max: 1004\nFirst violating rows: first_row\n'
+    check_printout(exp, capfd)
+
+def test_is_col_in_numeric_range():
+    """
+    ser values (must be numeric) are within specified range (True if so)
+    JDL 10/18/26
+    """
+    assert preflight.is_col_in_numeric_range(pd.Series([1, 2, 3]), 1, 3) == True
+    assert preflight.is_col_in_numeric_range(pd.Series([1, 2, 3]), ulim=2) == False
+    assert preflight.is_col_in_numeric_range(pd.Series([1., np.nan]), 0., 5.) == False
+    assert preflight.is_col_in_numeric_range(pd.Series([], dtype=float), 0., 5.) == True
+
+    # Nullable (extension) dtype uses comparison path
+    assert preflight.is_col_in_numeric_range(pd.Series([1, 4], dtype='Int64'), 0, 3) == False
+
+def test_CheckDataFrame_LstColsAllInNumericRangeBlock(checkdf2, capfd):
+    """
+    List of columns' values all within numeric range --one block reduction
+    JDL 10/18/26
+    """
+    lst = [1002, 1003, 1004]
+    assert checkdf2.LstColsAllInNumericRangeBlock(lst, 0., 0.1) == True
+
+    # All failing columns reported
+    checkdf2.errs.ResetWarning()
+    assert checkdf2.LstColsAllInNumericRangeBlock(lst, 0.03, 0.095) == False
+    assert checkdf2.lst_cols_failed == [1002, 1004]
+    exp = 'ERROR: Column values must be within specified numeric range: 1002, 1004\n'
+    check_printout(exp, capfd)
+
+    # Observed min/max and violating rows with nViolations
+    checkdf2.errs.ResetWarning()
+    assert checkdf2.LstColsAllInNumericRangeBlock(lst, 0.03, 0.095, nViolations=2) == False
+    exp = 'ERROR: Column values must be within specified numeric range: ' + \
+          '1002 (min 0.02, max 0.08; rows 1002); 1004 (min 0.04, max 0.1; rows 1004)\n'
+    check_printout(exp, capfd)
+
 def test_CheckDataFrame_ColValsMatchRegex1(checkdf1, capfd):
     """
     Specific table value matches regex pattern
@@ -737,7 +856,8 @@ def test_CheckDataFrame_ColValsMatchRegex1(checkdf1, capfd):
 
     # Test the column again with values that fail
     assert checkdf1.ColValsMatchRegex('Row_Name', str_regex) == False
-    exp = 'ERROR: Column values must match specified pattern: Row_Name\n'
+    exp = 'ERROR: Column values must match specified pattern: Row_Name\n' + \
+          'Non-match: first.row (row 0)\n'
     check_printout(exp, capfd)
 
 def test_CheckDataFrame_ColValsMatchRegex2(checkdf1, capfd):
@@ -766,9 +886,38 @@ def test_CheckDataFrame_ColValsMatchRegex2(checkdf1, capfd):
 
     # Test the column again with values that fail
     assert checkdf1.ColValsMatchRegex('Row_Name', str_regex, df=df_test) == False
-    exp = 'custom_ColValsMatchRegex: Row_Name\n'
+    exp = 'custom_ColValsMatchRegex: Row_Name\nNon-match: first.row (row 0)\n'
     check_printout(exp, capfd)
 
+def test_CheckDataFrame_ColValsMatchRegex3(checkdf1):
+    """
+    Non-object dtypes (datetime64, float32) match regex as str(x) of values
+    JDL 10/18/26
+    """
+    df_test = pd.DataFrame({'d': pd.to_datetime(['2024-01-02', '2024-05-06']),
+                            'f': np.array([1.1, 2.5], dtype='float32')})
+    assert checkdf1.ColValsMatchRegex('d', r'\d{4}-\d\d-\d\d \d\d:\d\d', df=df_test) == True
+    assert checkdf1.ColValsMatchRegex('f', r'1\.100000023', df=df_test) == False
+    assert preflight.mask_regex_mismatch(df_test['f'], r'1\.100000023').tolist() == [False, True]
+
+
+def test_first_regex_mismatch(monkeypatch):
+    """
+    Return position of first ser value (as str) not matching str_regex
+    JDL 10/18/26
+    """
+    # Small chunks to check positions across chunk boundaries
+    monkeypatch.setattr(preflight, 'nRowsRegexChunk', 3)
+    ser = pd.Series(['ab', 'cd', 'ef', 'gh', 'IJ', 'kl', 12])
+
+    assert preflight.first_regex_mismatch(ser[:4], '^[a-z]+$') is None
+    assert preflight.first_regex_mismatch(ser, '^[a-z]+$') == 4
+    assert preflight.first_regex_mismatch(ser, '^[a-z]+$', IgnoreCase=True) == 6
+    assert preflight.first_regex_mismatch(ser, '^[a-z0-9]+$', True) is None
+
+    # Compiled patterns are cached
+    assert preflight.compiled_regex('^[a-z]+$', True) is \
+            preflight.compiled_regex('^[a-z]+$', True)
 
 def test_CheckDataFrame_ColContainsListVals1(checkdf1, capfd):
     """
@@ -808,6 +957,41 @@ def test_CheckDataFrame_ColContainsListVals2(checkdf1, capfd):
     exp = 'custom_ColContainsListVals: \nMissing: 1005\n'
     check_printout(exp, capfd)
 
+def test_CheckDataFrame_ColContainsListVals3(checkdf1, capfd):
+    """
+    Individual column contains list of values (df arg used instead of
+    tbl.df; all missing values reported; cached column value index)
+    JDL 10/18/26
+    """
+    df_test = pd.DataFrame({'id_index': [2001, 2002, 2003]})
+    assert checkdf1.ColContainsListVals('id_index', [2001, 2003], df=df_test) == True
+
+    # All missing values reported together
+    checkdf1.errs.ResetWarning()
+    assert checkdf1.ColContainsListVals('id_index', [1002, 2002, 2005], df=df_test) == False
+    exp = 'ERROR: Column must contain specified list of values: \nMissing: 1002, 2005\n'
+    check_printout(exp, capfd)
+
+    # With IsCacheIndex, index is reused for same df until cache cleared
+    checkdf1.IsCacheIndex = True
+    idx_vals = checkdf1.ColValsIndex(df_test, 'id_index')
+    assert checkdf1.ColValsIndex(df_test, 'id_index') is idx_vals
+    df_test.loc[0, 'id_index'] = 2009
+    assert checkdf1.ColContainsListVals('id_index', [2001], df=df_test) == True
+    checkdf1.ClearValsIndexCache()
+    checkdf1.errs.ResetWarning()
+    assert checkdf1.ColContainsListVals('id_index', [2001], df=df_test) == False
+
+def test_lst_missing_vals():
+    """
+    Return list_vals items not present in vals
+    JDL 10/18/26
+    """
+    assert preflight.lst_missing_vals([1, 5, 'a', 2.0], pd.Series([1, 2, 2, 3])) == [5, 'a']
+    assert preflight.lst_missing_vals([1, 4], pd.Index([1, 2, 3])) == [4]
+    idx_multi = pd.MultiIndex.from_tuples([('a', 1), ('b', 2)])
+    assert preflight.lst_missing_vals([('a', 1), ('b', 1), 'b'], idx_multi) == [('b', 1)]
+
 def test_CheckDataFrame_ColContainsNodupsListVals1(checkdf1, capfd):
     """
     Column does not have duplicates of a list of values
@@ -822,7 +1006,7 @@ def test_CheckDataFrame_ColContainsNodupsListVals1(checkdf1, capfd):
     # Test the column again with values that fail
     checkdf1.tbl.df.loc['first_row', 'id_index'] = 1002
     assert checkdf1.ColContainsNodupsListVals('id_index', [1002, 1005]) == False
-    exp = 'ERROR: Specified list of column values must be unique (no duplicates): \nDuplicate: 1002\n'
+    exp = 'ERROR: Specified list of column values must be unique (no duplicates): \nDuplicate: 1002 (2 rows)\n'
     check_printout(exp, capfd)
 
 def test_CheckDataFrame_ColContainsNodupsListVals2(checkdf1, capfd):
@@ -845,9 +1029,19 @@ def test_CheckDataFrame_ColContainsNodupsListVals2(checkdf1, capfd):
     # Test the column again with values that fail
     checkdf1.tbl.df.loc['first_row', 'id_index'] = 1002
     assert checkdf1.ColContainsNodupsListVals('id_index', [1002, 1005], df=df_test) == False
-    exp = 'custom_ColContainsNodupsListVals: \nDuplicate: 1002\n'
+    exp = 'custom_ColContainsNodupsListVals: \nDuplicate: 1002 (2 rows)\n'
     check_printout(exp, capfd)
 
+def test_ser_dup_counts():
+    """
+    Return counts of list_vals values occurring more than once in ser
+    JDL 10/18/26
+    """
+    ser = pd.Series([1, 2, 2, 3, 3, 3, 4, 4, np.nan, np.nan])
+    dup_counts = preflight.ser_dup_counts(ser, [2, 3, 1, 5, np.nan])
+    assert dup_counts.to_dict() == {2: 2, 3: 3}
+    assert preflight.ser_dup_counts(ser, [1, 5]).size == 0
+
 def test_CheckDataFrame_TableLocMatchesRegex1(checkdf1, capfd):
     """
     Specific table value matches regex pattern
@@ -940,6 +1134,613 @@ def test_CheckDataFrame_NoDuplicateColVals2(checkdf1, capfd):
     exp = 'custom_NoDuplicateColVals: id_index\n'
     check_printout(exp, capfd)
 
+def test_CheckDataFrame_NoDuplicateColVals3(checkdf1, capfd):
+    """
+    Composite key columns; sorted and hashed uniqueness fast paths
+    JDL 10/18/26
+    """
+    # Sorted (either direction) settled by adjacent comparison
+    assert preflight.is_strict_monotonic(np.array([1, 3, 7])) == True
+    assert preflight.is_strict_monotonic(np.array([7., 3., 1.])) == True
+    assert preflight.is_strict_monotonic(np.array([1, 3, 3])) == False
+    assert preflight.is_strict_monotonic(np.array(['a', 'b'], dtype=object)) == False
+    assert preflight.is_unique_vals(pd.Series([3, 1, 2])) == True
+    assert preflight.is_unique_vals(pd.Index([1., np.nan, np.nan])) == False
+
+    # Composite key unique though each column has duplicates
+    checkdf1.IsViolations, checkdf1.errs.IsPrint = True, False
+    checkdf1.tbl.df.loc['third_row', 'Color'] = 'pink'
+    assert checkdf1.NoDuplicateColVals(['Select', 'Color']) == True
+    assert checkdf1.NoDuplicateColVals('Color') == False
+    checkdf1.errs.ResetWarning()
+    checkdf1.errs.IsPrint = True
+    checkdf1.tbl.df.loc['fourth_row', 'Color'] = 'blue'
+    assert checkdf1.NoDuplicateColVals(('Select', 'Color')) == False
+    exp = 'ERROR: DataFrame Column values must be unique: Select, Color\n'
+    check_printout(exp, capfd)
+    df_viol = checkdf1.ViolationTable()
+    assert df_viol['row'].tolist()[-2:] == ['second_row', 'fourth_row']
+    assert df_viol['column'].iloc[-1] == 'Select, Color'
+    assert df_viol['value'].iloc[-1] == ('x', 'blue')
+
+    # Reuse of cached values index
+    checkdf1.IsCacheIndex = True
+    assert checkdf1.NoDuplicateColVals('id_index') == True
+
+"""
+=========================================================================
+CheckDataFrame ...Block checks (list of columns checked in one pass)
+=========================================================================
+"""
+def test_CheckDataFrame_LstColsPopulatedBlock(checkdf1, capfd):
+    """
+    List of columns all populated with non-blank values (True if so)
+    JDL 10/18/26
+    """
+    assert checkdf1.LstColsPopulatedBlock(lst_cols=['id_index', 'Color']) == True
+    assert checkdf1.lst_cols_failed == []
+
+    # All failing columns reported in one message
+    checkdf1.errs.ResetWarning()
+    checkdf1.tbl.df.loc['first_row', 'Color'] = np.nan
+    lst = ['Select', 'id_index', 'Color']
+    assert checkdf1.LstColsPopulatedBlock(lst_cols=lst) == False
+    assert checkdf1.lst_cols_failed == ['Select', 'Color']
+    exp = 'ERROR: All column values must be non-null: Select, Color\n'
+    check_printout(exp, capfd)
+
+def test_CheckDataFrame_LstColsAllNonBlankBlock(checkdf1, capfd):
+    """
+    List of columns all contain at least one non-blank value (True if so)
+    JDL 10/18/26
+    """
+    assert checkdf1.LstColsAllNonBlankBlock(lst_cols=['Select', 'Color']) == True
+
+    # Custom error codes with all failing columns reported in one message
+    checkdf1.errs.ResetWarning()
+    checkdf1.errs.Locn = 'custom_ColNonBlank'
+    checkdf1.IsCustomCodes = True
+    checkdf1.tbl.df['blank1'] = np.nan
+    checkdf1.tbl.df['blank2'] = None
+    lst = ['blank1', 'Select', 'blank2']
+    assert checkdf1.LstColsAllNonBlankBlock(lst_cols=lst) == False
+    check_printout('custom_ColNonBlank: blank1, blank2\n', capfd)
+
+def test_CheckDataFrame_LstColsAllNumericBlock(checkdf1, capfd):
+    """
+    List of columns all non-blank numeric values (True if so)
+    JDL 10/18/26
+    """
+    df = checkdf1.tbl.df
+    df['num_str'] = ['1', '2.5', '3', '4']
+    df['mixed'] = [1, 'x', 3, 4]
+    df['num_nan'] = [1., np.nan, 3., 4.]
+    assert checkdf1.LstColsAllNumericBlock(lst_cols=['id_index', 'num_str']) == True
+
+    # Non-numeric dtype and numeric dtype columns with nulls both reported
+    checkdf1.errs.ResetWarning()
+    lst = ['id_index', 'Color', 'num_str', 'mixed', 'num_nan']
+    assert checkdf1.LstColsAllNumericBlock(lst_cols=lst) == False
+    exp = 'ERROR: Column must contain only non-null numeric values: ' + \
+          'Color, mixed, num_nan\n'
+    check_printout(exp, capfd)
+
+    # nViolations > 0 reports each column's non-numeric values and blanks
+    checkdf1.errs.ResetWarning()
+    assert checkdf1.LstColsAllNumericBlock(lst_cols=lst, nViolations=2) == False
+    exp = 'ERROR: Column must contain only non-null numeric values: ' + \
+          'Color (non-numeric green, blue; blanks 0); mixed (non-numeric x; blanks 0); ' + \
+          'num_nan (non-numeric ; blanks 1)\n'
+    check_printout(exp, capfd)
+    checkdf1.errs.ResetWarning()
+    assert checkdf1.LstColsAllNumeric(lst_cols=['id_index', 'mixed'], nViolations=2) == False
+    exp = 'ERROR: Column must contain only non-null numeric values: mixed\n' + \
+          'Non-numeric values: x\nBlank values: 0\n'
+    check_printout(exp, capfd)
+
+    # Block result matches ColNumeric column by column for other dtypes
+    df['date'] = pd.to_datetime(['2024-01-01', '2024-01-02', None, '2024-01-04'])
+    df['date_full'] = df['date'].fillna(pd.Timestamp('2024-01-03'))
+    df['cat'] = pd.Series(['1', '2', '3', 'x'], index=df.index, dtype='category')
+    df['n_Int64'] = pd.Series([1, None, 3, 4], index=df.index, dtype='Int64')
+    checkdf1.errs.IsPrint = False
+    for col in lst + ['date', 'date_full', 'cat', 'n_Int64']:
+        is_block = len(preflight.lst_cols_non_numeric(df[[col]])) == 0
+        assert is_block == checkdf1.ColNumeric(col), col
+
+def test_CheckDataFrame_pickle(checkdf1):
+    """
+    CheckDataFrame (with its ErrorHandle) can be pickled
+    JDL 10/18/26
+    """
+    checkdf2 = pickle.loads(pickle.dumps(checkdf1))
+    assert checkdf2.ColPopulated('Color') == True
+
+def test_CheckDataFrame_RecordCheckErr(checkdf1, capfd, monkeypatch):
+    """
+    Check Locn is static and resolved only when an error is recorded
+    JDL 10/18/26
+    """
+    monkeypatch.setattr(preflight.util, 'current_fn', None)
+    checkdf1.errs.Locn = 'unchanged'
+    assert checkdf1.ColPopulated('id_index') == True
+    assert checkdf1.errs.Locn == 'unchanged'
+
+    assert checkdf1.ColNonBlank('Select') == True
+    assert checkdf1.ColNumeric('Color') == False
+    assert checkdf1.errs.Locn == 'ColNumeric'
+    check_printout('ERROR: Column must contain only non-null numeric values: Color\n', capfd)
+
+def test_CheckDataFrame_IsCollectAll(checkdf1, capfd):
+    """
+    Collect-all and fail-fast execution modes
+    JDL 10/18/26
+    """
+    lst = ['id_index', 'Color', 'Select']
+
+    # Default LstCols... mode fails fast
+    assert checkdf1.LstColsAllNumeric(lst_cols=lst) == False
+    assert checkdf1.lst_cols_failed == ['Color']
+    check_printout('ERROR: Column must contain only non-null numeric values: Color\n', capfd)
+
+    # Collect-all reports every failing column
+    checkdf1.errs.ResetWarning()
+    checkdf1.IsCollectAll = True
+    assert checkdf1.LstColsAllNumeric(lst_cols=lst) == False
+    assert checkdf1.lst_cols_failed == ['Color', 'Select']
+    exp = 'ERROR: Column must contain only non-null numeric values: Color\n' + \
+          'ERROR: Column must contain only non-null numeric values: Select\n'
+    check_printout(exp, capfd)
+
+    checkdf1.errs.ResetWarning()
+    assert checkdf1.ContainsRequiredCols(['a', 'id_index', 'b']) == False
+    check_printout('ERROR: Required column not present: a, b\n', capfd)
+
+    # Explicit fail-fast stops CheckSchema at its first failure
+    checkdf1.errs.ResetWarning()
+    checkdf1.IsCollectAll = False
+    schema = TableSchema([ColSpec('Select', IsPopulated=True), ColSpec('Color', IsNumeric=True)])
+    assert checkdf1.CheckSchema(schema) == False
+    assert checkdf1.lst_cols_failed == ['Select']
+    check_printout('ERROR: All column values must be non-null: Select\n', capfd)
+
+def test_CheckDataFrame_ViolationTable(checkdf1, tmp_path, monkeypatch):
+    """
+    Columnar violation table of failed checks with .csv/.parquet export
+    JDL 10/18/26
+    """
+    checkdf1.IsViolations, checkdf1.errs.IsPrint = True, False
+    assert checkdf1.ViolationTable().columns.tolist() == preflight.lst_violation_cols
+    assert checkdf1.ColPopulated('Select') == False
+    assert checkdf1.ColValsInNumericRange('id_index', 1002, 1004) == False
+    assert checkdf1.ColContainsListVals('id_index', [1002, 1005, 1006]) == False
+    assert checkdf1.LstColsAllNonBlankBlock(lst_cols=['Color']) == True
+    checkdf1.tbl.df['blank'] = np.nan
+    assert checkdf1.LstColsAllNonBlankBlock(lst_cols=['blank', 'Color']) == False
+
+    # One row per violating df row, missing value or failing column
+    df_viol = checkdf1.ViolationTable()
+    assert df_viol['check'].tolist() == ['ColPopulated'] * 2 + \
+            ['ColValsInNumericRange'] + ['ColContainsListVals'] * 2 + ['ColNonBlank']
+    assert df_viol['row'].tolist() == ['first_row', 'third_row', 'first_row', None, None, None]
+    assert df_viol['value'].tolist()[2:5] == [1001, 1005, 1006]
+    assert df_viol['column'].tolist()[-2:] == ['id_index', 'blank']
+    assert (df_viol['table'] == 'df_test1').all()
+    assert df_viol['iCodeReport'].tolist()[:3] == [264, 264, 369]
+
+    # Export
+    path_csv = str(tmp_path / 'violations.csv')
+    assert checkdf1.WriteViolations(path_csv) == True
+    assert len(pd.read_csv(path_csv)) == 6
+    path_pq = str(tmp_path / 'violations.parquet')
+
+    # No parquet engine installed --logged and False, not raised
+    with monkeypatch.context() as m:
+        def to_parquet_no_engine(*args, **kwargs): raise ImportError('no parquet engine')
+        m.setattr(pd.DataFrame, 'to_parquet', to_parquet_no_engine)
+        assert checkdf1.WriteViolations(path_pq) == False
+    assert not os.path.exists(path_pq)
+
+    pytest.importorskip('pyarrow')
+    assert checkdf1.WriteViolations(path_pq) == True
+    assert pd.read_parquet(path_pq)['row'].tolist()[0] == 'first_row'
+
+def test_CheckDataFrame_RowMasks(checkdf1):
+    """
+    Bit-packed row masks of failed checks; combined mask, bits and split
+    JDL 10/18/26
+    """
+    checkdf1.IsRowMasks, checkdf1.errs.IsPrint = True, False
+    assert checkdf1.RowMask().size == 0
+    assert checkdf1.ColPopulated('Select') == False
+    assert checkdf1.ColValsInNumericRange('id_index', 1002, 1004) == False
+    assert checkdf1.ColPopulated('Color') == True
+
+    # Masks stored bit-packed per (check, column)
+    assert list(checkdf1.dict_row_masks) == [('ColPopulated', 'Select'), \
+                                             ('ColValsInNumericRange', 'id_index')]
+    assert checkdf1.dict_row_masks[('ColPopulated', 'Select')].dtype == np.uint8
+    assert checkdf1.RowMask(('ColPopulated', 'Select')).tolist() == [True, False, True, False]
+    assert checkdf1.RowMask().tolist() == [True, False, True, False]
+    assert checkdf1.RowCheckBits().tolist() == [3, 0, 1, 0]
+
+    # Quarantine violating rows in one step
+    df_good, df_bad = checkdf1.SplitRows()
+    assert df_good.index.tolist() == ['second_row', 'fourth_row']
+    assert df_bad.index.tolist() == ['first_row', 'third_row']
+
+    # Check of a df with a different row count records its error and
+    # replaces the stored masks
+    checkdf1.errs.ResetWarning()
+    assert checkdf1.ColPopulated('x', df=pd.DataFrame({'x':[np.nan]})) == False
+    assert checkdf1.errs.iCodeLocal == 4
+    assert list(checkdf1.dict_row_masks) == [('ColPopulated', 'x')]
+    assert checkdf1.RowMask().tolist() == [True]
+    checkdf1.ClearRowMasks()
+    assert checkdf1.RowMask().size == 0
+
+def test_CheckDataFrame_ResultCache(checkdf1, tmp_path):
+    """
+    Passing checks cached by content hash; failures rerun; LRU eviction
+    JDL 10/18/26
+    """
+    cache = preflight.CheckResultCache(tmp_path, nMaxEntries=3)
+    checkdf1.result_cache, checkdf1.errs.IsPrint = cache, False
+    assert checkdf1.ColPopulated('Color') == True
+    assert checkdf1.ColValsInNumericRange('id_index', 1001, 1004) == True
+    assert (cache.nHits, cache.nMisses) == (0, 2)
+
+    # Rerun on unchanged data hits; changed args or data miss
+    assert checkdf1.ColPopulated('Color') == True
+    assert checkdf1.ColValsInNumericRange('id_index', 1001, 1003) == False
+    assert checkdf1.ColValsInNumericRange('id_index', 1001, 1003) == False
+    assert (cache.nHits, cache.nMisses) == (1, 4)
+    checkdf1.tbl.df.loc['first_row', 'Color'] = None
+    assert checkdf1.ColPopulated('Color') == False
+    assert len(checkdf1.errs.Msgs_Accum) > 0
+
+    # Persisted to disk and reloaded; oldest entries evicted beyond nMaxEntries
+    assert checkdf1.NoDuplicateCols() == True
+    assert checkdf1.NoDuplicateIndices() == True
+    assert len(cache.dict_keys) == 3
+    cache.Save()
+    cache2 = preflight.CheckResultCache(tmp_path, nMaxEntries=3)
+    assert list(cache2.dict_keys) == list(cache.dict_keys)
+    checkdf1.result_cache = cache2
+    assert checkdf1.NoDuplicateIndices() == True
+    assert checkdf1.ColPopulated('Select') == False
+    assert (cache2.nHits, cache2.nMisses) == (1, 1)
+
+    # Keys stored as text; hits alone don't rewrite the file
+    with open(cache2.path_file) as f: assert f.read().split() == list(cache.dict_keys)
+    assert cache2.IsDirty == False
+
+    # Object values differing only in type ([1, 'a'] vs ['1', 'a']) not confused
+    df_a = pd.DataFrame({'k':[1, 'a']})
+    df_b = pd.DataFrame({'k':['1', 'a']})
+    assert checkdf1.ColContainsListVals('k', [1], df=df_a) == True
+    assert checkdf1.ColContainsListVals('k', [1], df=df_b) == False
+
+    # Composite key (list or tuple of columns) keyed on the key columns' values
+    df_keys = pd.DataFrame({'k1':[1, 1, 2], 'k2':['a', 'b', 'a']})
+    nHits = cache2.nHits
+    assert checkdf1.NoDuplicateColVals(('k1', 'k2'), df=df_keys) == True
+    assert checkdf1.NoDuplicateColVals(('k1', 'k2'), df=df_keys) == True
+    assert cache2.nHits == nHits + 1
+    df_keys.loc[1, 'k2'] = 'a'
+    assert checkdf1.NoDuplicateColVals(['k1', 'k2'], df=df_keys) == False
+
+"""
+=========================================================================
+Declarative TableSchema checks
+=========================================================================
+"""
+def test_TableSchema_CompilePlan(tbl):
+    """
+    Return list of merged ColSpecs --one per column in order of first spec
+    JDL 10/18/26
+    """
+    tbl.required_cols = ['a', 'b']
+    tbl.numeric_cols = ['b']
+    schema = TableSchema()
+    schema.SetFromTable(tbl)
+    schema.AddCol('b', IsRequired=False, llim=0, ulim=10)
+    schema.AddCol('b', IsRequired=False, llim=2, str_regex='^\\d+$')
+
+    lst_plan = schema.CompilePlan()
+    assert [spec.name for spec in lst_plan] == ['a', 'b']
+    spec = lst_plan[1]
+    assert spec.IsRequired and spec.IsNumeric and not spec.IsPopulated
+    assert (spec.llim, spec.ulim) == (2, 10)
+    assert spec.lst_regex == [('^\\d+$', False)]
+
+def test_CheckDataFrame_CheckSchema(checkdf1, capfd):
+    """
+    Check df against a TableSchema in one pass per column
+    JDL 10/18/26
+    """
+    schema = TableSchema([ColSpec('id_index', IsNumeric=True, IsPopulated=True, \
+                                  llim=1000, ulim=1005, IsUnique=True), \
+                          ColSpec('Color', IsPopulated=True, str_regex='^[a-z]+$')])
+    assert checkdf1.CheckSchema(schema) == True
+    assert checkdf1.lst_cols_failed == []
+
+    # Failures across several columns and checks are all reported
+    checkdf1.errs.ResetWarning()
+    schema.AddCol('Select', IsPopulated=True)
+    schema.AddCol('missing_col')
+    schema.AddCol('id_index', ulim=1003)
+    schema.AddCol('Color', IsUnique=True)
+    assert checkdf1.CheckSchema(schema) == False
+    assert checkdf1.lst_cols_failed == ['missing_col', 'Select', 'id_index', 'Color']
+    exp = 'ERROR: Required column not present: missing_col\n' + \
+          'ERROR: All column values must be non-null: Select\n' + \
+          'ERROR: Column values must be within specified numeric range: id_index\n' + \
+          'ERROR: DataFrame Column values must be unique: Color\n'
+    check_printout(exp, capfd)
+
+def test_CheckDataFrame_CheckSchema_no_tbl(df_test1):
+    """
+    Without a tbl, CheckSchema needs a schema arg (clear ValueError if not)
+    JDL 10/18/26
+    """
+    ckdf = CheckDataFrame(libs_dir)
+    with pytest.raises(ValueError):
+        ckdf.CheckSchema(df=df_test1)
+    schema = TableSchema([ColSpec('id_index', IsNumeric=True)])
+    assert ckdf.CheckSchema(schema, df=df_test1) == True
+
+def test_CheckDataFrame_CheckSchema_tbl(checkdf2, capfd):
+    """
+    Default schema built from .tbl column lists
+    JDL 10/18/26
+    """
+    checkdf2.tbl.required_cols = [1002, 1003]
+    checkdf2.tbl.numeric_cols = [1002, 1004]
+    assert checkdf2.CheckSchema() == True
+
+    checkdf2.errs.ResetWarning()
+    checkdf2.tbl.df[1004] = checkdf2.tbl.df[1004].astype(object)
+    checkdf2.tbl.df.loc[1003, 1004] = 'xyz'
+    assert checkdf2.CheckSchema() == False
+    exp = 'ERROR: Column must contain only non-null numeric values: 1004\n'
+    check_printout(exp, capfd)
+
+"""
+=========================================================================
+CheckDataFrame parallel column checks (nWorkers > 1)
+=========================================================================
+"""
+@pytest.mark.parametrize('IsProcessPool', [False, True])
+def test_CheckDataFrame_LstCols_parallel(checkdf2, capfd, IsProcessPool):
+    """
+    LstCols... checks with columns evaluated in a thread or process pool
+    JDL 10/18/26
+    """
+    checkdf2.nWorkers, checkdf2.IsProcessPool = 2, IsProcessPool
+    lst = [1002, 1003, 1004]
+
+    # Passing checks
+    assert checkdf2.LstColsPopulated(lst_cols=lst) == True
+    assert checkdf2.LstColsAllNonBlank(lst_cols=lst) == True
+    assert checkdf2.LstColsAllNumeric(lst_cols=lst) == True
+    assert checkdf2.LstColsAllInNumericRange(lst, 0., 0.1) == True
+    assert checkdf2.LstColsMatchRegex(lst, r'^0\.\d+$') == True
+
+    # First failing column in list order is reported (as in serial checks)
+    assert checkdf2.LstColsAllInNumericRange(lst, 0., 0.085) == False
+    exp = 'ERROR: Column values must be within specified numeric range: 1003\n'
+    check_printout(exp, capfd)
+    checkdf2.errs.ResetWarning()
+
+    checkdf2.tbl.df[1004] = checkdf2.tbl.df[1004].astype(object)
+    checkdf2.tbl.df.loc[1002, 1004] = 'xyz'
+    assert checkdf2.LstColsMatchRegex(lst, r'^0\.\d+$') == False
+    exp = 'ERROR: Column values must match specified pattern: 1004\n' + \
+          'Non-match: xyz (row 1002)\n'
+    check_printout(exp, capfd)
+    checkdf2.ShutdownExecutor()
+
+def test_CheckInputs_CheckTablesProcedure(df_test1, df_test2, capfd):
+    """
+    Check each table's df (in parallel if .nWorkers > 1) and merge the
+    errors into .errs in table order
+    JDL 10/18/26
+    """
+    # Two tables: first has non-numeric column; second is missing a column
+    tbl1 = Table('', 'tbl1', '', '')
+    tbl1.df, tbl1.numeric_cols = df_test1, ['id_index', 'Color']
+    tbl2 = Table('', 'tbl2', '', '')
+    tbl2.df, tbl2.required_cols = df_test2, [1002, 1005]
+
+    for nWorkers in [1, 2]:
+        ckinputs = CheckInputs(None, path_err_codes=libs_dir, nWorkers=nWorkers)
+        assert ckinputs.CheckTablesProcedure([tbl1, tbl2]) == False
+        exp = 'ERROR: Column must contain only non-null numeric values: Color\n' + \
+              'ERROR: Required column not present: 1005\n'
+        check_printout(exp, capfd)
+
+    # Collect-all reports each table's failing checks
+    tbl1.populated_cols = ['Select']
+    ckinputs = CheckInputs(None, path_err_codes=libs_dir, IsCollectAll=True)
+    assert ckinputs.CheckTablesProcedure([tbl1]) == False
+    exp = 'ERROR: Column must contain only non-null numeric values: Color\n' + \
+          'ERROR: All column values must be non-null: Select\n'
+    check_printout(exp, capfd)
+    tbl1.populated_cols = []
+
+    # Passing table
+    tbl1.numeric_cols = ['id_index']
+    assert ckinputs.CheckTablesProcedure([tbl1]) == True
+
+    # Error codes default to the libs directory
+    assert CheckInputs(None).CheckTablesProcedure([tbl1]) == True
+
+"""
+=========================================================================
+Streaming checks over DataFrame chunks
+=========================================================================
+"""
+@pytest.fixture
+def str_csv_chunks():
+    """
+    CSV text for chunked reads (duplicate id 3 and out-of-range/blank x
+    in different chunks)
+    """
+    return """id,x,Color
+    1,0.1,green
+    2,0.2,blue
+    3,0.3,
+    4,1.5,pink
+    3,0.5,green
+    """
+
+def test_CheckDataFrameChunks_CheckChunks1(str_csv_chunks, capfd):
+    """
+    Run added checks over chunks carrying state (all passing)
+    JDL 10/18/26
+    """
+    ckchunks = CheckDataFrameChunks(libs_dir)
+    ckchunks.AddCheck('ColPopulated', 'id')
+    ckchunks.AddCheck('ColNumeric', 'x')
+    ckchunks.AddCheck('ColValsInNumericRange', 'x', llim=0., ulim=2.)
+    ckchunks.AddCheck('ColContainsListVals', 'id', list_vals=[1, 4])
+    ckchunks.AddCheck('ColNonBlank', 'Color')
+    ckchunks.AddCheck('NoDuplicateIndices')
+    chunks = pd.read_csv(StringIO(str_csv_chunks), skipinitialspace=True, chunksize=2)
+    assert ckchunks.CheckChunks(chunks) == True
+    assert (ckchunks.nChunks, ckchunks.nRows) == (3, 5)
+    check_printout('', capfd)
+
+def test_CheckDataFrameChunks_CheckChunks2(str_csv_chunks, capfd):
+    """
+    Run added checks over chunks carrying state (failures across chunks)
+    JDL 10/18/26
+    """
+    ckchunks = CheckDataFrameChunks(libs_dir)
+    ckchunks.AddCheck('NoDuplicateColVals', 'id')
+    ckchunks.AddCheck('ColPopulated', 'Color')
+    ckchunks.AddCheck('ColValsInNumericRange', 'x', llim=0., ulim=1.)
+    ckchunks.AddCheck('ColContainsListVals', 'id', list_vals=[1, 5, 4, 6])
+    chunks = pd.read_csv(StringIO(str_csv_chunks), skipinitialspace=True, chunksize=2)
+    assert ckchunks.CheckChunks(chunks) == False
+    assert ckchunks.lst_cols_failed == ['id', 'Color', 'x']
+    exp = 'ERROR: DataFrame Column values must be unique: id\nDuplicates: 3\n' + \
+          'ERROR: All column values must be non-null: Color\n' + \
+          'ERROR: Column values must be within specified numeric range: x\n' + \
+          'ERROR: Column must contain specified list of values: \nMissing: 5, 6\n'
+    check_printout(exp, capfd)
+
+    # Fail-fast stops reading chunks after the first chunk with a failure
+    ckchunks.IsCollectAll = False
+    ckchunks.lst_check_specs = ckchunks.lst_check_specs[:2]
+    ckchunks.errs.ResetWarning()
+    chunks = pd.read_csv(StringIO(str_csv_chunks), skipinitialspace=True, chunksize=2)
+    assert ckchunks.CheckChunks(chunks) == False
+    assert ckchunks.nChunks == 2
+    check_printout('ERROR: All column values must be non-null: Color\n', capfd)
+
+    # Checked column not in first chunk
+    ckchunks = CheckDataFrameChunks(libs_dir)
+    ckchunks.AddCheck('ColPopulated', 'y')
+    assert ckchunks.CheckChunks([pd.DataFrame({'x':[1]})]) == False
+    check_printout('ERROR: Required column not present: y\n', capfd)
+
+def test_ChunkCheck_Abstract():
+    """
+    ChunkCheck base class can't be instantiated (subclasses implement Update)
+    JDL 10/18/26
+    """
+    with pytest.raises(TypeError):
+        preflight.ChunkCheck('ColPopulated', 'x')
+    assert preflight.ChunkPopulated('ColPopulated', 'x').ErrParam() == 'x'
+
+def test_ChunkNoDups_HashCollisions(monkeypatch):
+    """
+    Values with equal hashes are only duplicates if the values are equal;
+    state is kept as a few merged runs
+    JDL 10/18/26
+    """
+    monkeypatch.setattr(preflight.pd.util, 'hash_array', \
+                        lambda vals: np.zeros(len(vals), dtype=np.uint64))
+    ck = preflight.ChunkNoDups('NoDuplicateColVals', 'x')
+    for i in range(8): ck.Update(pd.DataFrame({'x':[2 * i, 2 * i + 1]}))
+    assert ck.IsFail == False
+    assert len(ck.lst_runs) == 1
+    ck.Update(pd.DataFrame({'x':[99, 5]}))
+    assert ck.IsFail == True
+    assert ck.lst_dups == [5]
+
+def test_ChunkNoDups_MixedDtypes():
+    """
+    Equal numeric values are duplicates across chunks of different dtypes
+    (read_csv reads a chunk with a blank id as float64); large ints that
+    share a float64 hash are not
+    JDL 10/18/26
+    """
+    ckchunks = CheckDataFrameChunks(libs_dir)
+    ckchunks.AddCheck('NoDuplicateColVals', 'id')
+    chunks = pd.read_csv(StringIO('id,x\n1,a\n3,b\n3,c\n,d\n'), chunksize=2)
+    assert ckchunks.CheckChunks(chunks) == False
+
+    ck = preflight.ChunkNoDups('NoDuplicateColVals', 'x')
+    ck.Update(pd.DataFrame({'x':[2**53, 7]}))
+    ck.Update(pd.DataFrame({'x':[2**53 + 1, 8]}))
+    ck.Update(pd.DataFrame({'x':[0.5, 1.5, 2.5, 3.5]}))
+    assert ck.IsFail == False
+    ck.Update(pd.DataFrame({'x':[7.0]}))
+    assert ck.IsFail == True
+    assert ck.lst_dups == [7.0]
+
+def test_CheckDataFrameChunks_CheckIncremental(monkeypatch, capfd):
+    """
+    Incremental revalidation: skip unchanged columns, check appended rows
+    with carried state and recheck edited columns in full
+    JDL 10/18/26
+    """
+    monkeypatch.setattr(preflight, 'nRowsFingerprintBlock', 2)
+    df = pd.DataFrame({'id':[1, 2, 3], 'x':[0.1, 0.2, 0.3]})
+    ckchunks = CheckDataFrameChunks(libs_dir)
+    ckchunks.AddCheck('NoDuplicateColVals', 'id')
+    ckchunks.AddCheck('ColContainsListVals', 'id', list_vals=[1, 5])
+    ckchunks.AddCheck('ColValsInNumericRange', 'x', llim=0., ulim=1.)
+    assert ckchunks.CheckIncremental(df) == False
+    assert ckchunks.lst_check_modes == ['full', 'full', 'full']
+    check_printout('ERROR: Column must contain specified list of values: \nMissing: 5\n', capfd)
+
+    # Unchanged df is not rechecked
+    ckchunks.errs.ResetWarning()
+    assert ckchunks.CheckIncremental(df) == False
+    assert ckchunks.lst_check_modes == ['skip', 'skip', 'skip']
+    check_printout('ERROR: Column must contain specified list of values: \nMissing: 5\n', capfd)
+
+    # Appended rows checked alone against carried uniqueness/membership state
+    ckchunks.errs.ResetWarning()
+    df = pd.concat([df, pd.DataFrame({'id':[5, 2], 'x':[0.4, 0.5]})], ignore_index=True)
+    assert ckchunks.CheckIncremental(df) == False
+    assert ckchunks.lst_check_modes == ['delta', 'delta', 'delta']
+    check_printout('ERROR: DataFrame Column values must be unique: id\nDuplicates: 2\n', capfd)
+
+    # Edited column rechecked in full; others skipped
+    ckchunks.errs.ResetWarning()
+    df.loc[4, 'id'], df.loc[0, 'x'] = 4, 1.5
+    assert ckchunks.CheckIncremental(df) == False
+    assert ckchunks.lst_check_modes == ['full', 'full', 'full']
+    check_printout('ERROR: Column values must be within specified numeric range: x\n', capfd)
+    ckchunks.errs.ResetWarning()
+    df.loc[0, 'x'] = 0.1
+    assert ckchunks.CheckIncremental(df) == True
+    assert ckchunks.lst_check_modes == ['skip', 'skip', 'full']
+
+    # Type-only edit in an object column changes its fingerprint
+    df['id'] = df['id'].astype(object)
+    assert ckchunks.CheckIncremental(df) == True
+    ckchunks.errs.ResetWarning()
+    df.loc[0, 'id'] = '1'
+    assert ckchunks.CheckIncremental(df) == False
+    assert ckchunks.lst_check_modes == ['full', 'full', 'skip']
+    check_printout('ERROR: Column must contain specified list of values: \nMissing: 1\n', capfd)
+
 def check_printout(expected, capfd):
     """
     Check that the printed output matches the expected output